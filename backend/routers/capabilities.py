@@ -0,0 +1,56 @@
+"""
+Capabilities Responses
+
+Shared helper for the /capabilities endpoints. Capabilities only change with
+the device's VyOS version and the instance, so responses carry an ETag and
+clients can revalidate with If-None-Match.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag.
+
+    Handles "*", comma-separated lists and weak W/ validators; as the
+    header requires, tags are compared weakly (the W/ prefix is ignored).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque
+        for tag in if_none_match.split(",")
+    )
+
+
+def capabilities_response(request: Request, capabilities: Dict[str, Any]) -> Response:
+    """
+    Build the response for a builder's capabilities.
+
+    Instance info is merged into the capabilities before encoding. The body
+    is encoded like FastAPI's JSONResponse (read-only mappings become dicts)
+    and the ETag is a hash of that body.
+    """
+    instance = getattr(request.state, "instance", None)
+    if instance:
+        capabilities = {
+            **capabilities,
+            "instance_name": instance.get("name"),
+            "instance_id": instance.get("id"),
+        }
+
+    body = json.dumps(capabilities, ensure_ascii=False, separators=(",", ":"), default=dict).encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from session_vyos_service import get_session_vyos_service
 from vyos_builders import FirewallGroupsBatchBuilder
+from routers.capabilities import capabilities_response
 
 router = APIRouter(prefix="/vyos/firewall/groups", tags=["firewall-groups"])
 
@@ -95,14 +96,7 @@ async def get_groups_capabilities(request: Request):
         service = get_session_vyos_service(request)
         version = service.get_version()
         builder = FirewallGroupsBatchBuilder(version=version)
-        capabilities = builder.get_capabilities()
-
-        # Add instance info
-        if hasattr(request.state, "instance") and request.state.instance:
-            capabilities["instance_name"] = request.state.instance.get("name")
-            capabilities["instance_id"] = request.state.instance.get("id")
-
-        return capabilities
+        return capabilities_response(request, builder.get_capabilities())
     except HTTPException:
         raise
     except Exception as e:
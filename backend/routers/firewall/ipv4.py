@@ -11,10 +11,15 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from session_vyos_service import get_session_vyos_service
 from vyos_builders import FirewallIPv4BatchBuilder
+from routers.capabilities import capabilities_response
 import inspect
 
 router = APIRouter(prefix="/vyos/firewall/ipv4", tags=["firewall_ipv4"])
 
+# Builder helpers that take structured arguments rather than request fields;
+# the batch endpoint only dispatches single set_*/delete_* operations
+_NON_BATCH_METHODS = frozenset(("set_rule_properties",))
+
 
 # Stub functions for backwards compatibility with app.py
 def set_device_registry(registry):
@@ -163,14 +168,7 @@ async def get_firewall_ipv4_capabilities(request: Request):
         service = get_session_vyos_service(request)
         version = service.get_version()
         builder = FirewallIPv4BatchBuilder(version=version)
-        capabilities = builder.get_capabilities()
-
-        # Add instance info
-        if hasattr(request.state, "instance") and request.state.instance:
-            capabilities["instance_name"] = request.state.instance.get("name")
-            capabilities["instance_id"] = request.state.instance.get("id")
-
-        return capabilities
+        return capabilities_response(request, builder.get_capabilities())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -436,7 +434,11 @@ async def firewall_ipv4_batch_configure(http_request: Request, request: Firewall
         # Process operations using inspect for dynamic method calls
         for operation in request.operations:
             method_name = operation.op
-            if not hasattr(builder, method_name):
+            if (
+                not method_name.startswith(("set_", "delete_"))
+                or method_name in _NON_BATCH_METHODS
+                or not hasattr(builder, method_name)
+            ):
                 raise HTTPException(
                     status_code=400,
                     detail=f"Unknown operation: {method_name}"
@@ -478,6 +480,10 @@ async def firewall_ipv4_batch_configure(http_request: Request, request: Firewall
             data={"message": "Firewall configuration updated"},
             error=response.error if response.error else None
         )
+    except HTTPException:
+        raise
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=f"Validation error: {str(ve)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from session_vyos_service import get_session_vyos_service
 from vyos_builders import NATBatchBuilder
+from routers.capabilities import capabilities_response
 
 router = APIRouter(prefix="/vyos/nat", tags=["nat"])
 
@@ -163,14 +164,7 @@ async def get_nat_capabilities(request: Request):
         service = get_session_vyos_service(request)
         version = service.get_version()
         builder = NATBatchBuilder(version=version)
-        capabilities = builder.get_capabilities()
-
-        # Add instance info
-        if hasattr(request.state, "instance") and request.state.instance:
-            capabilities["instance_name"] = request.state.instance.get("name")
-            capabilities["instance_id"] = request.state.instance.get("id")
-
-        return capabilities
+        return capabilities_response(request, builder.get_capabilities())
     except KeyError:
         raise HTTPException(status_code=404, detail="Device not found in registry")
     except Exception as e:
@@ -404,8 +398,9 @@ async def batch_configure_nat(http_request: Request, request: NATBatchRequest):
 
             logger.info(f"Processing operation: {op_name} with value: {op_value}")
 
-            # Get the method from batch builder
-            if not hasattr(batch, op_name):
+            # Get the method from batch builder; only single set_*/delete_*
+            # operations are dispatched (not helpers such as bulk_apply)
+            if not op_name.startswith(("set_", "delete_")) or not hasattr(batch, op_name):
                 raise HTTPException(
                     status_code=400,
                     detail=f"Unknown operation: {op_name}"
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers.firewall import ipv4 as ipv4_router
+from routers.firewall import ipv6 as ipv6_router
+from routers.nat import nat as nat_router
+
+
+class FakeService:
+    """Stands in for the session VyOS service; records executed batches."""
+
+    def __init__(self):
+        self.batches = []
+
+    def get_version(self):
+        return "1.5"
+
+    def execute_batch(self, builder):
+        self.batches.append(builder.get_operations())
+        return SimpleNamespace(status=200, error=None, result="")
+
+
+@pytest.fixture
+def service():
+    return FakeService()
+
+
+def _client(module, service, monkeypatch):
+    monkeypatch.setattr(module, "get_session_vyos_service", lambda request: service)
+    app = FastAPI()
+    app.include_router(module.router)
+    return TestClient(app)
+
+
+def _firewall_batch(ops, chain="forward"):
+    return {"chain": chain, "rule_number": 10, "is_custom_chain": False, "operations": ops}
+
+
+@pytest.mark.parametrize("module", [ipv4_router, ipv6_router])
+def test_firewall_batch_dispatches_rule_operations(module, service, monkeypatch):
+    client = _client(module, service, monkeypatch)
+    prefix = module.router.prefix
+
+    r = client.post(f"{prefix}/batch", json=_firewall_batch([{"op": "set_rule_action", "value": "accept"}]))
+
+    assert r.status_code == 200
+    assert service.batches[0][0]["path"][-2:] == ["action", "accept"]
+
+
+@pytest.mark.parametrize(
+    "module, op",
+    [
+        (ipv4_router, "set_rule_properties"),
+        (ipv4_router, "bulk_apply"),
+        (ipv4_router, "has_rule"),
+        (ipv4_router, "clear"),
+        (ipv4_router, "no_such_operation"),
+        (ipv6_router, "set_rule_properties"),
+        (ipv6_router, "set_rule_property_bulk"),
+        (ipv6_router, "bulk_apply"),
+        (ipv6_router, "compact"),
+    ],
+)
+def test_firewall_batch_rejects_non_operation_methods(module, op, service, monkeypatch):
+    client = _client(module, service, monkeypatch)
+
+    r = client.post(f"{module.router.prefix}/batch", json=_firewall_batch([{"op": op, "value": "x"}]))
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == f"Unknown operation: {op}"
+    assert service.batches == []
+
+
+@pytest.mark.parametrize("op", ["bulk_apply", "get_capabilities", "clear"])
+def test_nat_batch_rejects_non_operation_methods(op, service, monkeypatch):
+    client = _client(nat_router, service, monkeypatch)
+
+    r = client.post(
+        "/vyos/nat/batch",
+        json={"rule_number": 100, "nat_type": "source", "operations": [{"op": op}]},
+    )
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == f"Unknown operation: {op}"
+    assert service.batches == []
+
+
+@pytest.mark.parametrize("op", ["set_base_chain_default_action", "delete_base_chain_rule"])
+def test_ipv6_batch_unknown_base_chain_is_bad_request(op, service, monkeypatch):
+    client = _client(ipv6_router, service, monkeypatch)
+
+    r = client.post("/vyos/firewall/ipv6/batch", json=_firewall_batch([{"op": op, "value": "drop"}], chain="bogus"))
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Validation error: Unknown base chain: bogus"
+    assert service.batches == []
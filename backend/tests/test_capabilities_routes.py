@@ -0,0 +1,135 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+import pytest
+
+from routers.firewall import groups as groups_router
+from routers.firewall import ipv4 as ipv4_router
+from routers.firewall import ipv6 as ipv6_router
+from routers.nat import nat as nat_router
+from vyos_builders import (
+    FirewallGroupsBatchBuilder,
+    FirewallIPv4BatchBuilder,
+    FirewallIPv6BatchBuilder,
+    NATBatchBuilder,
+)
+
+
+class FakeService:
+    def __init__(self, version="1.5"):
+        self.version = version
+
+    def get_version(self):
+        return self.version
+
+
+ROUTES = [
+    (ipv4_router, FirewallIPv4BatchBuilder),
+    (ipv6_router, FirewallIPv6BatchBuilder),
+    (nat_router, NATBatchBuilder),
+    (groups_router, FirewallGroupsBatchBuilder),
+]
+
+
+def _client(module, monkeypatch, service=None, instance=None):
+    service = service or FakeService()
+    monkeypatch.setattr(module, "get_session_vyos_service", lambda request: service)
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def set_instance(request: Request, call_next):
+        request.state.instance = instance
+        return await call_next(request)
+
+    app.include_router(module.router)
+    return TestClient(app)
+
+
+def _capabilities_url(module):
+    return f"{module.router.prefix}/capabilities"
+
+
+@pytest.mark.parametrize("module, builder_cls", ROUTES)
+def test_capabilities_returns_builder_capabilities_with_etag(module, builder_cls, monkeypatch):
+    client = _client(module, monkeypatch)
+
+    r = client.get(_capabilities_url(module))
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.headers["etag"].startswith('"')
+    assert r.json() == _jsonable(builder_cls("1.5").get_capabilities())
+
+
+@pytest.mark.parametrize("module, builder_cls", ROUTES)
+def test_capabilities_merges_instance_info(module, builder_cls, monkeypatch):
+    client = _client(module, monkeypatch, instance={"id": "i-1", "name": "edge"})
+
+    body = client.get(_capabilities_url(module)).json()
+
+    assert body["instance_id"] == "i-1"
+    assert body["instance_name"] == "edge"
+    assert body["version"] == "1.5"
+
+
+@pytest.mark.parametrize("module, builder_cls", ROUTES)
+def test_capabilities_not_modified_for_matching_etag(module, builder_cls, monkeypatch):
+    client = _client(module, monkeypatch)
+    etag = client.get(_capabilities_url(module)).headers["etag"]
+
+    r = client.get(_capabilities_url(module), headers={"If-None-Match": etag})
+
+    assert r.status_code == 304
+    assert r.headers["etag"] == etag
+    assert r.content == b""
+
+
+def test_capabilities_etag_changes_with_version_and_instance(monkeypatch):
+    url = _capabilities_url(ipv4_router)
+    etags = {
+        _client(ipv4_router, monkeypatch).get(url).headers["etag"],
+        _client(ipv4_router, monkeypatch, service=FakeService("1.4")).get(url).headers["etag"],
+        _client(ipv4_router, monkeypatch, instance={"id": "i-1", "name": "edge"}).get(url).headers["etag"],
+    }
+    assert len(etags) == 3
+
+    etag = _client(ipv4_router, monkeypatch).get(url).headers["etag"]
+    client = _client(ipv4_router, monkeypatch, service=FakeService("1.4"))
+    r = client.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+
+
+def _jsonable(value):
+    if hasattr(value, "items"):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        "*",
+        "{etag}",
+        "W/{etag}",
+        '"other", {etag}',
+        '"other",W/{etag} , "more"',
+    ],
+)
+def test_capabilities_if_none_match_forms(header, monkeypatch):
+    client = _client(ipv4_router, monkeypatch)
+    url = _capabilities_url(ipv4_router)
+    etag = client.get(url).headers["etag"]
+
+    r = client.get(url, headers={"If-None-Match": header.format(etag=etag)})
+
+    assert r.status_code == 304
+
+
+@pytest.mark.parametrize("header", ['"other"', 'W/"other", "more"', ""])
+def test_capabilities_if_none_match_mismatch(header, monkeypatch):
+    client = _client(ipv4_router, monkeypatch)
+
+    r = client.get(_capabilities_url(ipv4_router), headers={"If-None-Match": header})
+
+    assert r.status_code == 200
@@ -0,0 +1,48 @@
+from vyos_builders import ExtCommunityListBatchBuilder
+
+
+def test_len_and_bool_follow_operations():
+    builder = ExtCommunityListBatchBuilder("1.5")
+    assert len(builder) == 0
+    assert not builder
+    assert builder.is_empty()
+
+    builder.set_extcommunity_list("cust").set_extcommunity_list_description("cust", "x")
+    assert len(builder) == builder.operation_count() == 2
+    assert builder
+    assert not builder.is_empty()
+
+    builder.clear()
+    assert len(builder) == builder.operation_count() == 0
+    assert not builder
+
+
+def test_empty_paths_are_skipped():
+    builder = ExtCommunityListBatchBuilder("1.5")
+    builder.add_set([]).add_delete([])
+
+    assert builder.get_operations() == []
+
+
+def test_iter_operations_matches_get_operations():
+    builder = ExtCommunityListBatchBuilder("1.5").set_extcommunity_list("cust")
+
+    assert list(builder.iter_operations()) == builder.get_operations()
+
+
+def test_chain_yields_operations_of_each_builder_in_order():
+    class OperationsOnly:
+        """Builder without iter_operations()."""
+
+        def get_operations(self):
+            return [{"op": "delete", "path": ["policy", "route-map", "rm"]}]
+
+    first = ExtCommunityListBatchBuilder("1.5").set_extcommunity_list("a")
+    second = ExtCommunityListBatchBuilder("1.5").delete_extcommunity_list("b")
+    legacy = OperationsOnly()
+
+    chained = list(ExtCommunityListBatchBuilder.chain(first, legacy, second))
+
+    assert chained == (
+        first.get_operations() + legacy.get_operations() + second.get_operations()
+    )
@@ -0,0 +1,172 @@
+import pytest
+
+from vyos_builders.firewall.ipv4 import FirewallIPv4BatchBuilder
+from vyos_builders.firewall.ipv6 import FirewallIPv6BatchBuilder
+
+
+def _actions(builder):
+    return [op["path"][-1] for op in builder.get_operations()]
+
+
+def test_ipv4_compact_keeps_overwritten_leaf_value():
+    builder = FirewallIPv4BatchBuilder("1.5")
+    builder.set_rule_action("forward", 10, "accept")
+    builder.set_rule_action("forward", 10, "drop")
+    builder.set_rule_action("forward", 10, "accept")
+
+    assert builder.compact() == 0
+    assert _actions(builder) == ["accept", "drop", "accept"]
+
+
+def test_ipv4_compact_drops_repeated_set():
+    builder = FirewallIPv4BatchBuilder("1.5")
+    builder.set_rule_action("forward", 10, "accept")
+    builder.set_rule_description("forward", 10, "web")
+    builder.set_rule_action("forward", 10, "accept")
+
+    assert builder.compact() == 1
+    assert _actions(builder) == ["accept", "web"]
+
+
+def test_ipv6_compact_keeps_overwritten_leaf_value():
+    builder = FirewallIPv6BatchBuilder("1.5")
+    builder.set_rule_action("forward", 10, "accept")
+    builder.set_rule_action("forward", 10, "drop")
+    builder.set_rule_action("forward", 10, "accept")
+
+    assert builder.compact() == 0
+    assert _actions(builder) == ["accept", "drop", "accept"]
+
+
+def test_ipv6_dedup_keeps_overwritten_leaf_value():
+    builder = FirewallIPv6BatchBuilder("1.5", dedup=True)
+    builder.set_rule_action("forward", 10, "accept")
+    builder.set_rule_properties("forward", 10, {"action": "drop"})
+    builder.set_rule_property_bulk("forward", [10], "action", ["accept"])
+
+    assert _actions(builder) == ["accept", "drop", "accept"]
+
+
+def test_ipv6_dedup_skips_repeated_set():
+    builder = FirewallIPv6BatchBuilder("1.5", dedup=True)
+    builder.set_rule_action("forward", 10, "accept")
+    builder.set_rule_description("forward", 10, "web")
+    builder.set_rule_action("forward", 10, "accept")
+
+    assert _actions(builder) == ["accept", "web"]
+
+
+def test_ipv4_repeated_deletes_do_not_share_paths():
+    builder = FirewallIPv4BatchBuilder("1.5")
+    builder.delete_rule_log("input", 10)
+    builder.set_rule_action("input", 10, "accept")
+    builder.delete_rule_log("input", 10)
+
+    ops = builder.get_operations()
+    assert ops[0]["path"] is not ops[-1]["path"]
+
+    ops[0]["path"].append("mutated")
+    assert "mutated" not in ops[-1]["path"]
+
+    # The cached path is unaffected for later deletes
+    builder.set_rule_action("input", 10, "drop")
+    builder.delete_rule_log("input", 10)
+    assert builder.get_operations()[-1]["path"] == ["firewall", "ipv4", "input", "filter", "rule", "10", "log"]
+
+
+@pytest.mark.parametrize("builder_cls", [FirewallIPv4BatchBuilder, FirewallIPv6BatchBuilder])
+def test_set_rule_properties_matches_individual_setters(builder_cls):
+    fused = builder_cls("1.5")
+    fused.set_rule_properties("forward", 10, {"description": "web", "action": "accept"})
+    single = builder_cls("1.5")
+    single.set_rule_description("forward", 10, "web")
+    single.set_rule_action("forward", 10, "accept")
+
+    assert fused.get_operations() == single.get_operations()
+
+
+@pytest.mark.parametrize("builder_cls", [FirewallIPv4BatchBuilder, FirewallIPv6BatchBuilder])
+def test_set_rule_properties_rejects_unknown_property(builder_cls):
+    builder = builder_cls("1.5")
+
+    with pytest.raises(ValueError, match="bogus"):
+        builder.set_rule_properties("forward", 10, {"action": "accept", "bogus": "x"})
+    assert builder.is_empty()
+
+
+@pytest.mark.parametrize("builder_cls", [FirewallIPv4BatchBuilder, FirewallIPv6BatchBuilder])
+def test_bulk_apply_matches_individual_calls(builder_cls):
+    bulk = builder_cls("1.5")
+    bulk.bulk_apply([
+        ("set", "action", "forward", 10, "accept"),
+        ("delete", "log", "web", 5, True),
+    ])
+    single = builder_cls("1.5")
+    single.set_rule_action("forward", 10, "accept")
+    single.delete_rule_log("web", 5, True)
+
+    assert bulk.get_operations() == single.get_operations()
+
+
+@pytest.mark.parametrize("builder_cls", [FirewallIPv4BatchBuilder, FirewallIPv6BatchBuilder])
+def test_bulk_apply_unknown_operation_leaves_batch_unchanged(builder_cls):
+    builder = builder_cls("1.5")
+
+    with pytest.raises(ValueError, match="bogus"):
+        builder.bulk_apply([("set", "action", "forward", 10, "accept"), ("set", "bogus", "forward", 10)])
+    assert builder.is_empty()
+
+
+def test_ipv4_has_rule():
+    builder = FirewallIPv4BatchBuilder("1.5")
+    builder.set_rule_action("forward", 10, "accept")
+    builder.set_rule_action("web", 20, "drop", True)
+
+    assert builder.has_rule("forward", 10)
+    assert builder.has_rule("web", 20, True)
+    assert not builder.has_rule("forward", 20)
+    assert not builder.has_rule("web", 10, True)
+
+    builder.clear()
+    assert not builder.has_rule("forward", 10)
+
+
+def test_ipv6_set_rule_property_bulk():
+    bulk = FirewallIPv6BatchBuilder("1.5")
+    bulk.set_rule_property_bulk("forward", [10, 20], "action", ["accept", "drop"])
+    single = FirewallIPv6BatchBuilder("1.5")
+    single.set_rule_action("forward", 10, "accept")
+    single.set_rule_action("forward", 20, "drop")
+
+    assert bulk.get_operations() == single.get_operations()
+
+
+def test_ipv6_set_rule_property_bulk_rejects_length_mismatch():
+    builder = FirewallIPv6BatchBuilder("1.5")
+
+    with pytest.raises(ValueError):
+        builder.set_rule_property_bulk("forward", [10, 20], "action", ["accept"])
+    assert builder.is_empty()
+
+
+def test_ipv4_source_mac_keeps_mac_keyword():
+    builder = FirewallIPv4BatchBuilder("1.5")
+    builder.set_rule_source_mac("forward", 10, mac="00:11:22:33:44:55")
+    builder.delete_rule_source_mac("forward", 10)
+    expected = FirewallIPv4BatchBuilder("1.5")
+    expected.set_rule_source_mac_address("forward", 10, "00:11:22:33:44:55")
+    expected.delete_rule_source_mac_address("forward", 10)
+
+    assert builder.get_operations() == expected.get_operations()
+
+
+@pytest.mark.parametrize("dedup", [False, True])
+def test_ipv6_empty_paths_are_skipped(dedup):
+    builder = FirewallIPv6BatchBuilder("1.5", dedup=dedup)
+    builder.add_set([])
+    builder.add_delete([])
+    builder.set_rule_action("forward", 10, "accept")
+    builder.add_set([])
+
+    assert builder.operation_count() == 1
+    assert _actions(builder) == ["accept"]
@@ -0,0 +1,48 @@
+import pytest
+
+from vyos_builders import FirewallGroupsBatchBuilder
+
+
+@pytest.mark.parametrize(
+    "bulk, single",
+    [
+        ("add_many_address_group_addresses", "set_address_group_address"),
+        ("add_many_ipv6_address_group_addresses", "set_ipv6_address_group_address"),
+        ("add_many_network_group_networks", "set_network_group_network"),
+        ("add_many_ipv6_network_group_networks", "set_ipv6_network_group_network"),
+        ("add_many_port_group_ports", "set_port_group_port"),
+        ("add_many_interface_group_interfaces", "set_interface_group_interface"),
+        ("add_many_mac_group_macs", "set_mac_group_mac"),
+    ],
+)
+def test_add_many_matches_single_setters(bulk, single):
+    members = ["m1", "m2", "m3"]
+    expected = FirewallGroupsBatchBuilder("1.5")
+    for member in members:
+        getattr(expected, single)("grp", member)
+
+    builder = FirewallGroupsBatchBuilder("1.5")
+    assert getattr(builder, bulk)("grp", iter(members)) is builder
+    assert builder.get_operations() == expected.get_operations()
+
+
+def test_add_many_appends_after_existing_operations():
+    builder = FirewallGroupsBatchBuilder("1.5").set_address_group("grp")
+    builder.add_many_address_group_addresses("grp", ["10.0.0.1", "10.0.0.2"])
+    builder.add_many_address_group_addresses("grp", [])
+
+    assert builder.get_operations() == [
+        {"op": "set", "path": ["firewall", "group", "address-group", "grp"]},
+        {"op": "set", "path": ["firewall", "group", "address-group", "grp", "address", "10.0.0.1"]},
+        {"op": "set", "path": ["firewall", "group", "address-group", "grp", "address", "10.0.0.2"]},
+    ]
+
+
+def test_operations_use_op_strings_and_fresh_path_lists():
+    builder = FirewallGroupsBatchBuilder("1.5").set_port_group("web").delete_port_group("web")
+
+    first = builder.get_operations()
+    first[0]["path"].append("mutated")
+
+    assert [op["op"] for op in builder.get_operations()] == ["set", "delete"]
+    assert builder.get_operations()[0]["path"] == ["firewall", "group", "port-group", "web"]
@@ -0,0 +1,24 @@
+import pytest
+
+from vyos_builders.nat.nat import NATBatchBuilder
+
+
+def test_bulk_apply_matches_individual_calls():
+    bulk = NATBatchBuilder("1.5")
+    bulk.bulk_apply([
+        ("set", "source_rule_protocol", 10, "tcp"),
+        ("delete", "destination_rule", 20),
+    ])
+    single = NATBatchBuilder("1.5")
+    single.set_source_rule_protocol(10, "tcp")
+    single.delete_destination_rule(20)
+
+    assert bulk.get_operations() == single.get_operations()
+
+
+def test_bulk_apply_unknown_operation_leaves_batch_unchanged():
+    builder = NATBatchBuilder("1.5")
+
+    with pytest.raises(ValueError, match="bogus"):
+        builder.bulk_apply([("set", "source_rule_protocol", 10, "tcp"), ("set", "bogus", 10)])
+    assert builder.is_empty()
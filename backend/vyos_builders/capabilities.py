@@ -0,0 +1,24 @@
+"""
+Builder Capabilities
+
+Helpers for the capabilities mappings the batch builders cache per version.
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze_capabilities(value: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Builders cache their capabilities per version and share the result
+    between instances, so the cached value must not be mutable.
+    get_capabilities() hands out a shallow dict copy of it, which routers
+    extend with top-level keys such as instance_name and instance_id.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze_capabilities(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_capabilities(v) for v in value)
+    return value
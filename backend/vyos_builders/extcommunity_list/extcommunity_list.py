@@ -5,7 +5,7 @@ Provides batch operations for extcommunity-list configuration.
 Commands are identical between VyOS 1.4 and 1.5.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from vyos_mappers.extcommunity_list import ExtCommunityListMapper
 
 
@@ -42,6 +42,26 @@ class ExtCommunityListBatchBuilder:
         """Get the list of operations."""
         return self._operations.copy()
 
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the operations without copying the batch."""
+        return iter(self._operations)
+
+    @staticmethod
+    def chain(*builders: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the operations of several builders in order.
+
+        Lets one commit payload be assembled from multiple feature builders
+        without copying each batch first. Builders without iter_operations()
+        fall back to get_operations().
+        """
+        for builder in builders:
+            iter_operations = getattr(builder, "iter_operations", None)
+            if iter_operations is not None:
+                yield from iter_operations()
+            else:
+                yield from builder.get_operations()
+
     def operation_count(self) -> int:
         """Get the number of operations in the batch."""
         return len(self._operations)
@@ -50,6 +70,14 @@ class ExtCommunityListBatchBuilder:
         """Check if the batch is empty."""
         return len(self._operations) == 0
 
+    def __len__(self) -> int:
+        """Number of operations; same as operation_count()."""
+        return len(self._operations)
+
+    def __bool__(self) -> bool:
+        """True if the batch has operations; the inverse of is_empty()."""
+        return bool(self._operations)
+
     # ========================================================================
     # ExtCommunity List Operations
     # ========================================================================
@@ -4,21 +4,36 @@ Firewall Groups Batch Builder
 Provides all firewall group batch operations following the standard pattern.
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Mapping, Tuple
 from vyos_mappers import CommandMapperRegistry
+from vyos_builders.capabilities import freeze_capabilities
 
 
 class FirewallGroupsBatchBuilder:
     """Complete batch builder for firewall group operations"""
 
+    __slots__ = (
+        "version",
+        "_operations",
+        "mappers",
+        "mapper_key",
+        "_m",
+        "_ops_append",
+    )
+
     def __init__(self, version: str):
         """Initialize firewall groups batch builder."""
         self.version = version
-        self._operations: List[Dict[str, Any]] = []
+        self._operations: List[Tuple[str, Tuple[str, ...]]] = []
 
         # Get firewall groups mapper for this version
         self.mappers = CommandMapperRegistry.get_all_mappers(version)
         self.mapper_key = "firewall_groups"
+        self._m = self.mappers[self.mapper_key]
+
+        # Bound append for the hot add_set/add_delete path
+        self._ops_append = self._operations.append
 
     # ========================================================================
     # Core Batch Operations
@@ -26,21 +41,26 @@ class FirewallGroupsBatchBuilder:
 
     def add_set(self, path: List[str]) -> "FirewallGroupsBatchBuilder":
         """Add a 'set' operation to the batch."""
-        self._operations.append({"op": "set", "path": path})
+        self._ops_append(("set", tuple(path)))
         return self
 
     def add_delete(self, path: List[str]) -> "FirewallGroupsBatchBuilder":
         """Add a 'delete' operation to the batch."""
-        self._operations.append({"op": "delete", "path": path})
+        self._ops_append(("delete", tuple(path)))
         return self
 
     def clear(self) -> None:
         """Clear all operations from the batch."""
-        self._operations = []
+        self._operations.clear()
 
     def get_operations(self) -> List[Dict[str, Any]]:
-        """Get the list of operations."""
-        return self._operations.copy()
+        """Get the list of operations as {"op": ..., "path": [...]} dicts."""
+        return [{"op": op, "path": list(path)} for op, path in self._operations]
+
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the operations as dicts without building a list."""
+        for op, path in self._operations:
+            yield {"op": op, "path": list(path)}
 
     def operation_count(self) -> int:
         """Get the number of operations in the batch."""
@@ -56,19 +76,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_address_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create address group."""
-        path = self.mappers[self.mapper_key].get_address_group(group_name)
+        path = self._m.get_address_group(group_name)
         return self.add_set(path)
 
     def delete_address_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete address group."""
-        path = self.mappers[self.mapper_key].get_address_group(group_name)
+        path = self._m.get_address_group(group_name)
         return self.add_delete(path)
 
     def set_address_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set address group description."""
-        path = self.mappers[self.mapper_key].get_address_group_description(
+        path = self._m.get_address_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -77,21 +97,21 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete address group description."""
-        path = self.mappers[self.mapper_key].get_address_group_description_path(group_name)
+        path = self._m.get_address_group_description_path(group_name)
         return self.add_delete(path)
 
     def set_address_group_address(
         self, group_name: str, address: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add address to address group."""
-        path = self.mappers[self.mapper_key].get_address_group_address(group_name, address)
+        path = self._m.get_address_group_address(group_name, address)
         return self.add_set(path)
 
     def delete_address_group_address(
         self, group_name: str, address: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove address from address group."""
-        path = self.mappers[self.mapper_key].get_address_group_address(group_name, address)
+        path = self._m.get_address_group_address(group_name, address)
         return self.add_delete(path)
 
     # ========================================================================
@@ -100,19 +120,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_ipv6_address_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create IPv6 address group."""
-        path = self.mappers[self.mapper_key].get_ipv6_address_group(group_name)
+        path = self._m.get_ipv6_address_group(group_name)
         return self.add_set(path)
 
     def delete_ipv6_address_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete IPv6 address group."""
-        path = self.mappers[self.mapper_key].get_ipv6_address_group(group_name)
+        path = self._m.get_ipv6_address_group(group_name)
         return self.add_delete(path)
 
     def set_ipv6_address_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set IPv6 address group description."""
-        path = self.mappers[self.mapper_key].get_ipv6_address_group_description(
+        path = self._m.get_ipv6_address_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -121,7 +141,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete IPv6 address group description."""
-        path = self.mappers[self.mapper_key].get_ipv6_address_group_description_path(
+        path = self._m.get_ipv6_address_group_description_path(
             group_name
         )
         return self.add_delete(path)
@@ -130,7 +150,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str, address: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add address to IPv6 address group."""
-        path = self.mappers[self.mapper_key].get_ipv6_address_group_address(
+        path = self._m.get_ipv6_address_group_address(
             group_name, address
         )
         return self.add_set(path)
@@ -139,7 +159,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str, address: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove address from IPv6 address group."""
-        path = self.mappers[self.mapper_key].get_ipv6_address_group_address(
+        path = self._m.get_ipv6_address_group_address(
             group_name, address
         )
         return self.add_delete(path)
@@ -150,19 +170,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_network_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create network group."""
-        path = self.mappers[self.mapper_key].get_network_group(group_name)
+        path = self._m.get_network_group(group_name)
         return self.add_set(path)
 
     def delete_network_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete network group."""
-        path = self.mappers[self.mapper_key].get_network_group(group_name)
+        path = self._m.get_network_group(group_name)
         return self.add_delete(path)
 
     def set_network_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set network group description."""
-        path = self.mappers[self.mapper_key].get_network_group_description(
+        path = self._m.get_network_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -171,21 +191,21 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete network group description."""
-        path = self.mappers[self.mapper_key].get_network_group_description_path(group_name)
+        path = self._m.get_network_group_description_path(group_name)
         return self.add_delete(path)
 
     def set_network_group_network(
         self, group_name: str, network: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add network to network group."""
-        path = self.mappers[self.mapper_key].get_network_group_network(group_name, network)
+        path = self._m.get_network_group_network(group_name, network)
         return self.add_set(path)
 
     def delete_network_group_network(
         self, group_name: str, network: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove network from network group."""
-        path = self.mappers[self.mapper_key].get_network_group_network(group_name, network)
+        path = self._m.get_network_group_network(group_name, network)
         return self.add_delete(path)
 
     # ========================================================================
@@ -194,19 +214,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_ipv6_network_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create IPv6 network group."""
-        path = self.mappers[self.mapper_key].get_ipv6_network_group(group_name)
+        path = self._m.get_ipv6_network_group(group_name)
         return self.add_set(path)
 
     def delete_ipv6_network_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete IPv6 network group."""
-        path = self.mappers[self.mapper_key].get_ipv6_network_group(group_name)
+        path = self._m.get_ipv6_network_group(group_name)
         return self.add_delete(path)
 
     def set_ipv6_network_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set IPv6 network group description."""
-        path = self.mappers[self.mapper_key].get_ipv6_network_group_description(
+        path = self._m.get_ipv6_network_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -215,7 +235,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete IPv6 network group description."""
-        path = self.mappers[self.mapper_key].get_ipv6_network_group_description_path(
+        path = self._m.get_ipv6_network_group_description_path(
             group_name
         )
         return self.add_delete(path)
@@ -224,7 +244,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str, network: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add network to IPv6 network group."""
-        path = self.mappers[self.mapper_key].get_ipv6_network_group_network(
+        path = self._m.get_ipv6_network_group_network(
             group_name, network
         )
         return self.add_set(path)
@@ -233,7 +253,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str, network: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove network from IPv6 network group."""
-        path = self.mappers[self.mapper_key].get_ipv6_network_group_network(
+        path = self._m.get_ipv6_network_group_network(
             group_name, network
         )
         return self.add_delete(path)
@@ -244,19 +264,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_port_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create port group."""
-        path = self.mappers[self.mapper_key].get_port_group(group_name)
+        path = self._m.get_port_group(group_name)
         return self.add_set(path)
 
     def delete_port_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete port group."""
-        path = self.mappers[self.mapper_key].get_port_group(group_name)
+        path = self._m.get_port_group(group_name)
         return self.add_delete(path)
 
     def set_port_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set port group description."""
-        path = self.mappers[self.mapper_key].get_port_group_description(
+        path = self._m.get_port_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -265,21 +285,21 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete port group description."""
-        path = self.mappers[self.mapper_key].get_port_group_description_path(group_name)
+        path = self._m.get_port_group_description_path(group_name)
         return self.add_delete(path)
 
     def set_port_group_port(
         self, group_name: str, port: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add port to port group."""
-        path = self.mappers[self.mapper_key].get_port_group_port(group_name, port)
+        path = self._m.get_port_group_port(group_name, port)
         return self.add_set(path)
 
     def delete_port_group_port(
         self, group_name: str, port: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove port from port group."""
-        path = self.mappers[self.mapper_key].get_port_group_port(group_name, port)
+        path = self._m.get_port_group_port(group_name, port)
         return self.add_delete(path)
 
     # ========================================================================
@@ -288,19 +308,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_interface_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create interface group."""
-        path = self.mappers[self.mapper_key].get_interface_group(group_name)
+        path = self._m.get_interface_group(group_name)
         return self.add_set(path)
 
     def delete_interface_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete interface group."""
-        path = self.mappers[self.mapper_key].get_interface_group(group_name)
+        path = self._m.get_interface_group(group_name)
         return self.add_delete(path)
 
     def set_interface_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set interface group description."""
-        path = self.mappers[self.mapper_key].get_interface_group_description(
+        path = self._m.get_interface_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -309,7 +329,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete interface group description."""
-        path = self.mappers[self.mapper_key].get_interface_group_description_path(
+        path = self._m.get_interface_group_description_path(
             group_name
         )
         return self.add_delete(path)
@@ -318,7 +338,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str, interface: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add interface to interface group."""
-        path = self.mappers[self.mapper_key].get_interface_group_interface(
+        path = self._m.get_interface_group_interface(
             group_name, interface
         )
         return self.add_set(path)
@@ -327,7 +347,7 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str, interface: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove interface from interface group."""
-        path = self.mappers[self.mapper_key].get_interface_group_interface(
+        path = self._m.get_interface_group_interface(
             group_name, interface
         )
         return self.add_delete(path)
@@ -338,19 +358,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_mac_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create MAC group."""
-        path = self.mappers[self.mapper_key].get_mac_group(group_name)
+        path = self._m.get_mac_group(group_name)
         return self.add_set(path)
 
     def delete_mac_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete MAC group."""
-        path = self.mappers[self.mapper_key].get_mac_group(group_name)
+        path = self._m.get_mac_group(group_name)
         return self.add_delete(path)
 
     def set_mac_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set MAC group description."""
-        path = self.mappers[self.mapper_key].get_mac_group_description(
+        path = self._m.get_mac_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -359,21 +379,21 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete MAC group description."""
-        path = self.mappers[self.mapper_key].get_mac_group_description_path(group_name)
+        path = self._m.get_mac_group_description_path(group_name)
         return self.add_delete(path)
 
     def set_mac_group_mac(
         self, group_name: str, mac: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add MAC address to MAC group."""
-        path = self.mappers[self.mapper_key].get_mac_group_mac(group_name, mac)
+        path = self._m.get_mac_group_mac(group_name, mac)
         return self.add_set(path)
 
     def delete_mac_group_mac(
         self, group_name: str, mac: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove MAC address from MAC group."""
-        path = self.mappers[self.mapper_key].get_mac_group_mac(group_name, mac)
+        path = self._m.get_mac_group_mac(group_name, mac)
         return self.add_delete(path)
 
     # ========================================================================
@@ -382,19 +402,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_domain_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create domain group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_domain_group(group_name)
+        path = self._m.get_domain_group(group_name)
         return self.add_set(path)
 
     def delete_domain_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete domain group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_domain_group(group_name)
+        path = self._m.get_domain_group(group_name)
         return self.add_delete(path)
 
     def set_domain_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set domain group description (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_domain_group_description(
+        path = self._m.get_domain_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -403,21 +423,21 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete domain group description (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_domain_group_description_path(group_name)
+        path = self._m.get_domain_group_description_path(group_name)
         return self.add_delete(path)
 
     def set_domain_group_address(
         self, group_name: str, address: str
     ) -> "FirewallGroupsBatchBuilder":
         """Add domain to domain group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_domain_group_address(group_name, address)
+        path = self._m.get_domain_group_address(group_name, address)
         return self.add_set(path)
 
     def delete_domain_group_address(
         self, group_name: str, address: str
     ) -> "FirewallGroupsBatchBuilder":
         """Remove domain from domain group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_domain_group_address(group_name, address)
+        path = self._m.get_domain_group_address(group_name, address)
         return self.add_delete(path)
 
     # ========================================================================
@@ -426,19 +446,19 @@ class FirewallGroupsBatchBuilder:
 
     def set_remote_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Create remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_remote_group(group_name)
+        path = self._m.get_remote_group(group_name)
         return self.add_set(path)
 
     def delete_remote_group(self, group_name: str) -> "FirewallGroupsBatchBuilder":
         """Delete remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_remote_group(group_name)
+        path = self._m.get_remote_group(group_name)
         return self.add_delete(path)
 
     def set_remote_group_description(
         self, group_name: str, description: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set remote group description (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_remote_group_description(
+        path = self._m.get_remote_group_description(
             group_name, description
         )
         return self.add_set(path)
@@ -447,14 +467,14 @@ class FirewallGroupsBatchBuilder:
         self, group_name: str
     ) -> "FirewallGroupsBatchBuilder":
         """Delete remote group description (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_remote_group_description_path(group_name)
+        path = self._m.get_remote_group_description_path(group_name)
         return self.add_delete(path)
 
     def set_remote_group_url(
         self, group_name: str, url: str
     ) -> "FirewallGroupsBatchBuilder":
         """Set remote group URL (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_remote_group_url(group_name, url)
+        path = self._m.get_remote_group_url(group_name, url)
         return self.add_set(path)
 
     def delete_remote_group_url(
@@ -466,9 +486,64 @@ class FirewallGroupsBatchBuilder:
             group_name: Name of the remote group
             url: Optional URL to delete. If provided, deletes specific URL.
         """
-        path = self.mappers[self.mapper_key].get_remote_group_url_path(group_name, url)
+        path = self._m.get_remote_group_url_path(group_name, url)
         return self.add_delete(path)
 
+    # ========================================================================
+    # Bulk Member Operations
+    # ========================================================================
+
+    def _add_many_set(
+        self, getter: Callable[[str, str], List[str]], group_name: str, members: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add a 'set' operation for each group member in one tight loop."""
+        append = self._ops_append
+        for member in members:
+            append(("set", tuple(getter(group_name, member))))
+        return self
+
+    def add_many_address_group_addresses(
+        self, group_name: str, addresses: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add several addresses to an address group."""
+        return self._add_many_set(self._m.get_address_group_address, group_name, addresses)
+
+    def add_many_ipv6_address_group_addresses(
+        self, group_name: str, addresses: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add several addresses to an IPv6 address group."""
+        return self._add_many_set(self._m.get_ipv6_address_group_address, group_name, addresses)
+
+    def add_many_network_group_networks(
+        self, group_name: str, networks: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add several networks to a network group."""
+        return self._add_many_set(self._m.get_network_group_network, group_name, networks)
+
+    def add_many_ipv6_network_group_networks(
+        self, group_name: str, networks: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add several networks to an IPv6 network group."""
+        return self._add_many_set(self._m.get_ipv6_network_group_network, group_name, networks)
+
+    def add_many_port_group_ports(
+        self, group_name: str, ports: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add several ports to a port group."""
+        return self._add_many_set(self._m.get_port_group_port, group_name, ports)
+
+    def add_many_interface_group_interfaces(
+        self, group_name: str, interfaces: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add several interfaces to an interface group."""
+        return self._add_many_set(self._m.get_interface_group_interface, group_name, interfaces)
+
+    def add_many_mac_group_macs(
+        self, group_name: str, macs: Iterable[str]
+    ) -> "FirewallGroupsBatchBuilder":
+        """Add several MAC addresses to a MAC group."""
+        return self._add_many_set(self._m.get_mac_group_mac, group_name, macs)
+
     # ========================================================================
     # Capabilities
     # ========================================================================
@@ -480,144 +555,71 @@ class FirewallGroupsBatchBuilder:
         Returns:
             Dictionary of supported features and operations
         """
-        # Base capabilities for all versions
-        capabilities = {
-            "version": self.version,
-            "version_number": float(self.version),
-            "group_types": {
-                "address_group": {
-                    "supported": True,
-                    "description": "IPv4 address group",
-                    "member_type": "address"
-                },
-                "ipv6_address_group": {
-                    "supported": True,
-                    "description": "IPv6 address group",
-                    "member_type": "address"
-                },
-                "network_group": {
-                    "supported": True,
-                    "description": "IPv4 network group",
-                    "member_type": "network"
-                },
-                "ipv6_network_group": {
-                    "supported": True,
-                    "description": "IPv6 network group",
-                    "member_type": "network"
-                },
-                "port_group": {
-                    "supported": True,
-                    "description": "Port group (TCP/UDP ports)",
-                    "member_type": "port"
-                },
-                "interface_group": {
-                    "supported": True,
-                    "description": "Interface group",
-                    "member_type": "interface"
-                },
-                "mac_group": {
-                    "supported": True,
-                    "description": "MAC address group",
-                    "member_type": "mac"
-                },
-                "domain_group": {
-                    "supported": self.version == "1.5",
-                    "description": "Domain name group (1.5+)",
-                    "member_type": "domain"
-                },
-                "remote_group": {
-                    "supported": self.version == "1.5",
-                    "description": "Remote address group (1.5+)",
-                    "member_type": "url"
-                }
-            },
-            "operations": {
-                "address_group": [
-                    "set_address_group",
-                    "delete_address_group",
-                    "set_address_group_address",
-                    "delete_address_group_address",
-                    "set_address_group_description",
-                    "delete_address_group_description"
-                ],
-                "ipv6_address_group": [
-                    "set_ipv6_address_group",
-                    "delete_ipv6_address_group",
-                    "set_ipv6_address_group_address",
-                    "delete_ipv6_address_group_address",
-                    "set_ipv6_address_group_description",
-                    "delete_ipv6_address_group_description"
-                ],
-                "network_group": [
-                    "set_network_group",
-                    "delete_network_group",
-                    "set_network_group_network",
-                    "delete_network_group_network",
-                    "set_network_group_description",
-                    "delete_network_group_description"
-                ],
-                "ipv6_network_group": [
-                    "set_ipv6_network_group",
-                    "delete_ipv6_network_group",
-                    "set_ipv6_network_group_network",
-                    "delete_ipv6_network_group_network",
-                    "set_ipv6_network_group_description",
-                    "delete_ipv6_network_group_description"
-                ],
-                "port_group": [
-                    "set_port_group",
-                    "delete_port_group",
-                    "set_port_group_port",
-                    "delete_port_group_port",
-                    "set_port_group_description",
-                    "delete_port_group_description"
-                ],
-                "interface_group": [
-                    "set_interface_group",
-                    "delete_interface_group",
-                    "set_interface_group_interface",
-                    "delete_interface_group_interface",
-                    "set_interface_group_description",
-                    "delete_interface_group_description"
-                ],
-                "mac_group": [
-                    "set_mac_group",
-                    "delete_mac_group",
-                    "set_mac_group_mac",
-                    "delete_mac_group_mac",
-                    "set_mac_group_description",
-                    "delete_mac_group_description"
-                ]
-            }
+        return dict(_build_capabilities(self.version))
+
+
+# ============================================================================
+# Capabilities
+# ============================================================================
+
+# Group types: (name, description, member_type, member operation suffix, needs 1.5+).
+# Each type exposes the same six set_/delete_ operations on this builder.
+_GROUP_TYPES = (
+    ("address_group", "IPv4 address group", "address", "address", False),
+    ("ipv6_address_group", "IPv6 address group", "address", "address", False),
+    ("network_group", "IPv4 network group", "network", "network", False),
+    ("ipv6_network_group", "IPv6 network group", "network", "network", False),
+    ("port_group", "Port group (TCP/UDP ports)", "port", "port", False),
+    ("interface_group", "Interface group", "interface", "interface", False),
+    ("mac_group", "MAC address group", "mac", "mac", False),
+    ("domain_group", "Domain name group (1.5+)", "domain", "address", True),
+    ("remote_group", "Remote address group (1.5+)", "url", "url", True),
+)
+
+
+def _group_operations(group_type: str, member_op: str) -> List[str]:
+    """List the builder operations available for a group type."""
+    return [
+        f"set_{group_type}",
+        f"delete_{group_type}",
+        f"set_{group_type}_{member_op}",
+        f"delete_{group_type}_{member_op}",
+        f"set_{group_type}_description",
+        f"delete_{group_type}_description",
+    ]
+
+
+@lru_cache(maxsize=8)
+def _build_capabilities(version: str) -> Mapping[str, Any]:
+    """Build the read-only capabilities mapping for a VyOS version."""
+    # Parse the version once; domain and remote groups need VyOS 1.5+
+    version_number = float(version)
+    is_15_plus = version == "1.5"
+
+    group_types = {}
+    operations = {}
+    for group_type, description, member_type, member_op, needs_15 in _GROUP_TYPES:
+        supported = is_15_plus or not needs_15
+        group_types[group_type] = {
+            "supported": supported,
+            "description": description,
+            "member_type": member_type,
         }
-
-        # Add domain_group and remote_group operations for VyOS 1.5+
-        if self.version == "1.5":
-            capabilities["operations"]["domain_group"] = [
-                "set_domain_group",
-                "delete_domain_group",
-                "set_domain_group_address",
-                "delete_domain_group_address",
-                "set_domain_group_description",
-                "delete_domain_group_description"
-            ]
-            capabilities["operations"]["remote_group"] = [
-                "set_remote_group",
-                "delete_remote_group",
-                "set_remote_group_url",
-                "delete_remote_group_url",
-                "set_remote_group_description",
-                "delete_remote_group_description"
-            ]
-
-        # Calculate statistics
-        total_operations = sum(len(ops) for ops in capabilities["operations"].values())
-        capabilities["statistics"] = {
-            "total_group_types": len([gt for gt in capabilities["group_types"].values() if gt["supported"]]),
-            "total_operations": total_operations
-        }
-
-        return capabilities
+        if supported:
+            operations[group_type] = _group_operations(group_type, member_op)
+
+    capabilities = {
+        "version": version,
+        "version_number": version_number,
+        "group_types": group_types,
+        "operations": operations,
+        "statistics": {
+            "total_group_types": sum(1 for gt in group_types.values() if gt["supported"]),
+            "total_operations": sum(len(ops) for ops in operations.values()),
+        },
+    }
+
+    return freeze_capabilities(capabilities)
 
 
 # Export as FirewallGroupsBatchBuilder for consistency
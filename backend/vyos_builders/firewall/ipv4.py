@@ -5,45 +5,197 @@ Provides all batch operations for IPv4 firewall rules.
 Handles both base chains (forward, input, output) and custom named chains.
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Mapping, Set, Tuple
 from vyos_mappers import CommandMapperRegistry
+from vyos_mappers.firewall import FirewallIPv4Mapper
+from vyos_builders.capabilities import freeze_capabilities
+
+
+# Mapper path getters, bound per builder as ``_g_<name>`` (e.g.
+# get_rule_action -> _g_rule_action) so wrappers skip the mapper lookup.
+# The versioned mapper resolves methods through __getattr__, so the names
+# are taken from the base mapper class.
+_MAPPER_GETTERS = tuple(
+    name for name in dir(FirewallIPv4Mapper) if name.startswith("get_")
+)
+
+# Upper bound on memoized delete paths per builder
+_PATH_CACHE_SIZE = 4096
+
+# Value-taking rule properties accepted by set_rule_properties(), mapped to
+# the bound getter that builds their path (set_rule_<prop> -> _g_rule_<prop>)
+_RULE_PROPERTY_GETTERS = {
+    prop: "_g_rule_" + prop
+    for prop in (
+        "description",
+        "action",
+        "protocol",
+        "source_address",
+        "source_port",
+        "source_mac_address",
+        "source_geoip_country",
+        "source_group_address",
+        "source_group_network",
+        "source_group_port",
+        "source_group_mac",
+        "source_group_domain",
+        "source_group_remote",
+        "destination_address",
+        "destination_port",
+        "destination_geoip_country",
+        "destination_group_address",
+        "destination_group_network",
+        "destination_group_port",
+        "destination_group_mac",
+        "destination_group_domain",
+        "destination_group_remote",
+        "inbound_interface",
+        "outbound_interface",
+        "set_dscp",
+        "set_mark",
+        "set_ttl",
+        "tcp_flags",
+        "icmp_type_name",
+        "jump_target",
+    )
+}
+
+# Rule operations accepted by bulk_apply(): ("set", prop) resolves to the
+# getter behind set_rule_<prop>, ("delete", prop) to the one behind
+# delete_rule_<prop>
+_BULK_RULE_GETTERS = {
+    ("delete", name[9:-5]) if name.endswith("_path") else ("set", name[9:]): "_g_" + name[4:]
+    for name in _MAPPER_GETTERS
+    if name.startswith("get_rule_")
+}
 
 
 class FirewallIPv4BatchBuilder:
     """Complete batch builder for IPv4 firewall operations"""
 
+    __slots__ = (
+        "version",
+        "_operations",
+        "mappers",
+        "mapper_key",
+        "_mapper",
+        "_path_cache",
+        "_rule_index",
+        "_indexed_operations",
+        "_indexed_count",
+    ) + tuple("_g_" + name[4:] for name in _MAPPER_GETTERS)
+
     def __init__(self, version: str):
         """Initialize firewall IPv4 batch builder."""
         self.version = version
-        self._operations: List[Dict[str, Any]] = []
+        self._operations: List[Tuple[str, List[str]]] = []
 
         # Get firewall IPv4 mapper for this version
         self.mappers = CommandMapperRegistry.get_all_mappers(version)
         self.mapper_key = "firewall_ipv4"
+        self._mapper = self.mappers[self.mapper_key]
+        for name in _MAPPER_GETTERS:
+            setattr(self, "_g_" + name[4:], getattr(self._mapper, name))
+        self._path_cache: Dict[Tuple[Any, ...], Tuple[str, ...]] = {}
+
+        # Rules touched by the batch, indexed lazily by has_rule()
+        self._rule_index: Set[Tuple[str, str, bool]] = set()
+        self._indexed_operations: List[Tuple[str, List[str]]] = self._operations
+        self._indexed_count = 0
 
     # ========================================================================
     # Core Batch Operations
     # ========================================================================
 
+    # The wrappers below go straight to _append(): mapper getters always
+    # return a non-empty path, so the empty-path check is only kept here for
+    # callers passing their own paths.
+
     def add_set(self, path: List[str]) -> "FirewallIPv4BatchBuilder":
         """Add a 'set' operation to the batch."""
         if path:  # Only add if path is not empty
-            self._operations.append({"op": "set", "path": path})
+            self._append("set", path)
         return self
 
     def add_delete(self, path: List[str]) -> "FirewallIPv4BatchBuilder":
         """Add a 'delete' operation to the batch."""
         if path:
-            self._operations.append({"op": "delete", "path": path})
+            self._append("delete", path)
+        return self
+
+    def _append(self, op: str, path: List[str]) -> "FirewallIPv4BatchBuilder":
+        """
+        Append an operation unless it repeats the previous one.
+
+        UI edits can emit the same operation twice in a row (e.g. a toggled
+        checkbox); a repeated set is redundant and a repeated delete would
+        fail on the device.
+        """
+        entry = (op, path)
+        operations = self._operations
+        if not operations or operations[-1] != entry:
+            operations.append(entry)
         return self
 
+    def _delete_path(self, getter: Callable[..., List[str]], *args: Any) -> List[str]:
+        """
+        Return the delete path for getter(*args), memoized per builder.
+
+        Deleting a rule usually removes several of its properties, so the
+        same (chain, rule_number, is_custom) paths come up repeatedly. The
+        cache holds tuples and every call returns a fresh list, so no two
+        operations share a path object.
+        """
+        key = (getter, args)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = tuple(getter(*args))
+            if len(self._path_cache) >= _PATH_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._path_cache[next(iter(self._path_cache))]
+            self._path_cache[key] = path
+        return list(path)
+
     def clear(self) -> None:
         """Clear all operations from the batch."""
         self._operations = []
 
+    def compact(self) -> int:
+        """
+        Drop operations that cannot change the result of the batch.
+
+        A 'set' is dropped when the last set under the same parent path had
+        the same final element and no delete has come since. Single-value
+        leaves carry their value as the last path element, so a different
+        value in between (action accept -> drop -> accept) keeps the repeat.
+        Deletes are always kept. Returns the number of operations removed.
+        """
+        # Last final element set under each parent path
+        last: Dict[Tuple[str, ...], str] = {}
+        kept = []
+        for op, path in self._operations:
+            if op == "set":
+                parent = tuple(path[:-1])
+                if last.get(parent) == path[-1]:
+                    continue
+                last[parent] = path[-1]
+            else:
+                last.clear()
+            kept.append((op, path))
+
+        removed = len(self._operations) - len(kept)
+        self._operations = kept
+        return removed
+
     def get_operations(self) -> List[Dict[str, Any]]:
         """Get the list of operations."""
-        return self._operations.copy()
+        return [{"op": op, "path": path} for op, path in self._operations]
+
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the operations as dicts without building a list."""
+        for op, path in self._operations:
+            yield {"op": op, "path": path}
 
     def operation_count(self) -> int:
         """Get the number of operations in the batch."""
@@ -53,29 +205,64 @@ class FirewallIPv4BatchBuilder:
         """Check if the batch is empty."""
         return len(self._operations) == 0
 
+    def __len__(self) -> int:
+        """Number of operations; same as operation_count()."""
+        return len(self._operations)
+
+    def __bool__(self) -> bool:
+        """True if the batch has operations; the inverse of is_empty()."""
+        return bool(self._operations)
+
+    def has_rule(self, chain: str, rule_number: int, is_custom: bool = False) -> bool:
+        """
+        Check if the batch has any operation on a rule.
+
+        The index is only brought up to date here, for operations added since
+        the last call, so appends stay free of bookkeeping.
+        """
+        operations = self._operations
+        if operations is not self._indexed_operations:
+            # clear() or compact() replaced the list; re-index from scratch
+            self._rule_index = set()
+            self._indexed_operations = operations
+            self._indexed_count = 0
+
+        index = self._rule_index
+        for _, path in operations[self._indexed_count:]:
+            # Base chains: firewall ipv4 <chain> filter rule <n> ...
+            # Custom chains: firewall ipv4 name <chain> rule <n> ...
+            if len(path) > 5 and path[4] == "rule":
+                if path[2] == "name":
+                    index.add((path[3], path[5], True))
+                else:
+                    index.add((path[2], path[5], False))
+        self._indexed_count = len(operations)
+
+        return (chain, str(rule_number), is_custom) in index
+
     # ========================================================================
     # Base Chain Rule Operations
     # ========================================================================
 
     def set_base_chain_rule(self, chain: str, rule_number: int) -> "FirewallIPv4BatchBuilder":
         """Create a rule in a base chain (forward, input, output)."""
-        path = self.mappers[self.mapper_key].get_base_chain_rule(chain, rule_number)
-        return self.add_set(path)
+        path = self._g_base_chain_rule(chain, rule_number)
+        return self._append("set", path)
 
     def delete_base_chain_rule(self, chain: str, rule_number: int) -> "FirewallIPv4BatchBuilder":
         """Delete a rule from a base chain."""
-        path = self.mappers[self.mapper_key].get_base_chain_rule_path(chain, rule_number)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_base_chain_rule_path, chain, rule_number)
+        return self._append("delete", path)
 
     def set_base_chain_default_action(self, chain: str, action: str) -> "FirewallIPv4BatchBuilder":
         """Set default action for a base chain."""
-        path = self.mappers[self.mapper_key].get_base_chain_default_action(chain, action)
-        return self.add_set(path)
+        path = self._g_base_chain_default_action(chain, action)
+        return self._append("set", path)
 
     def delete_base_chain_default_action(self, chain: str) -> "FirewallIPv4BatchBuilder":
         """Delete default action from a base chain."""
-        path = self.mappers[self.mapper_key].get_base_chain_default_action_path(chain)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_base_chain_default_action_path, chain)
+        return self._append("delete", path)
 
     # ========================================================================
     # Custom Chain Operations
@@ -83,43 +270,43 @@ class FirewallIPv4BatchBuilder:
 
     def set_custom_chain(self, chain_name: str) -> "FirewallIPv4BatchBuilder":
         """Create a custom named chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain(chain_name)
-        return self.add_set(path)
+        path = self._g_custom_chain(chain_name)
+        return self._append("set", path)
 
     def delete_custom_chain(self, chain_name: str) -> "FirewallIPv4BatchBuilder":
         """Delete a custom named chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_path(chain_name)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_custom_chain_path, chain_name)
+        return self._append("delete", path)
 
     def set_custom_chain_description(self, chain_name: str, description: str) -> "FirewallIPv4BatchBuilder":
         """Set description for a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_description(chain_name, description)
-        return self.add_set(path)
+        path = self._g_custom_chain_description(chain_name, description)
+        return self._append("set", path)
 
     def delete_custom_chain_description(self, chain_name: str) -> "FirewallIPv4BatchBuilder":
         """Delete description from a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_description_path(chain_name)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_custom_chain_description_path, chain_name)
+        return self._append("delete", path)
 
     def set_custom_chain_default_action(self, chain_name: str, action: str) -> "FirewallIPv4BatchBuilder":
         """Set default action for a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_default_action(chain_name, action)
-        return self.add_set(path)
+        path = self._g_custom_chain_default_action(chain_name, action)
+        return self._append("set", path)
 
     def delete_custom_chain_default_action(self, chain_name: str) -> "FirewallIPv4BatchBuilder":
         """Delete default action from a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_default_action_path(chain_name)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_custom_chain_default_action_path, chain_name)
+        return self._append("delete", path)
 
     def set_custom_chain_rule(self, chain_name: str, rule_number: int) -> "FirewallIPv4BatchBuilder":
         """Create a rule in a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_rule(chain_name, rule_number)
-        return self.add_set(path)
+        path = self._g_custom_chain_rule(chain_name, rule_number)
+        return self._append("set", path)
 
     def delete_custom_chain_rule(self, chain_name: str, rule_number: int) -> "FirewallIPv4BatchBuilder":
         """Delete a rule from a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_rule_path(chain_name, rule_number)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_custom_chain_rule_path, chain_name, rule_number)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - Common
@@ -127,53 +314,53 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_description(self, chain: str, rule_number: int, description: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set rule description."""
-        path = self.mappers[self.mapper_key].get_rule_description(chain, rule_number, description, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_description(chain, rule_number, description, is_custom)
+        return self._append("set", path)
 
     def delete_rule_description(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete rule description."""
-        path = self.mappers[self.mapper_key].get_rule_description_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_description_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_action(self, chain: str, rule_number: int, action: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set rule action (accept, drop, reject, continue, return, jump, queue, synproxy)."""
-        path = self.mappers[self.mapper_key].get_rule_action(chain, rule_number, action, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_action(chain, rule_number, action, is_custom)
+        return self._append("set", path)
 
     def delete_rule_action(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete rule action."""
-        path = self.mappers[self.mapper_key].get_rule_action_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_action_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_disable(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Disable a rule."""
-        path = self.mappers[self.mapper_key].get_rule_disable(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_disable(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_disable(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable a rule (remove disable flag)."""
-        path = self.mappers[self.mapper_key].get_rule_disable_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_disable_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_log(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable logging for a rule."""
-        path = self.mappers[self.mapper_key].get_rule_log(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_log(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_log(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Disable logging for a rule."""
-        path = self.mappers[self.mapper_key].get_rule_log_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_log_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_protocol(self, chain: str, rule_number: int, protocol: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set rule protocol."""
-        path = self.mappers[self.mapper_key].get_rule_protocol(chain, rule_number, protocol, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_protocol(chain, rule_number, protocol, is_custom)
+        return self._append("set", path)
 
     def delete_rule_protocol(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete rule protocol."""
-        path = self.mappers[self.mapper_key].get_rule_protocol_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_protocol_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - Source
@@ -181,123 +368,123 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_source_address(self, chain: str, rule_number: int, address: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source address."""
-        path = self.mappers[self.mapper_key].get_rule_source_address(chain, rule_number, address, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_address(chain, rule_number, address, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source address."""
-        path = self.mappers[self.mapper_key].get_rule_source_address_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_address_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_port(self, chain: str, rule_number: int, port: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source port."""
-        path = self.mappers[self.mapper_key].get_rule_source_port(chain, rule_number, port, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_port(chain, rule_number, port, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source port."""
-        path = self.mappers[self.mapper_key].get_rule_source_port_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_port_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_mac_address(self, chain: str, rule_number: int, mac_address: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac_address(chain, rule_number, mac_address, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_mac_address(chain, rule_number, mac_address, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_mac_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac_address_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_mac_address_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_geoip_country(self, chain: str, rule_number: int, country_code: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_country(chain, rule_number, country_code, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_geoip_country(chain, rule_number, country_code, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_geoip_country(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_country_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_geoip_country_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable source GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_inverse(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_geoip_inverse(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_inverse_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_geoip_inverse_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def delete_rule_source_geoip(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete the entire source GeoIP node (used when removing the last country)."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_geoip_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def delete_rule_source(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete the entire source node (used when switching to 'any')."""
-        path = self.mappers[self.mapper_key].get_rule_source_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_group_address(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source address group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_address(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_group_address(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_group_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source address group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_address_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_group_address_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_group_network(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source network group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_network(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_group_network(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_group_network(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source network group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_network_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_group_network_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_group_port(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source port group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_port(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_group_port(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_group_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source port group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_port_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_group_port_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_group_mac(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_mac(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_group_mac(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_group_mac(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_mac_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_group_mac_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_group_domain(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source domain group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_domain(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_group_domain(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_group_domain(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source domain group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_domain_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_group_domain_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_mac(self, chain: str, rule_number: int, mac: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac(chain, rule_number, mac, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_mac(chain, rule_number, mac, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_mac(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_mac_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - Destination
@@ -305,123 +492,123 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_destination_address(self, chain: str, rule_number: int, address: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination address."""
-        path = self.mappers[self.mapper_key].get_rule_destination_address(chain, rule_number, address, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_address(chain, rule_number, address, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination address."""
-        path = self.mappers[self.mapper_key].get_rule_destination_address_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_address_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_port(self, chain: str, rule_number: int, port: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination port."""
-        path = self.mappers[self.mapper_key].get_rule_destination_port(chain, rule_number, port, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_port(chain, rule_number, port, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination port."""
-        path = self.mappers[self.mapper_key].get_rule_destination_port_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_port_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_geoip_country(self, chain: str, rule_number: int, country_code: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_country(chain, rule_number, country_code, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_geoip_country(chain, rule_number, country_code, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_geoip_country(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_country_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_geoip_country_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable destination GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_inverse(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_geoip_inverse(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_inverse_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_geoip_inverse_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def delete_rule_destination_geoip(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete the entire destination GeoIP node (used when removing the last country)."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_geoip_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def delete_rule_destination(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete the entire destination node (used when switching to 'any')."""
-        path = self.mappers[self.mapper_key].get_rule_destination_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_group_address(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination address group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_address(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_group_address(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_group_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination address group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_address_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_group_address_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_group_network(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination network group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_network(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_group_network(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_group_network(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination network group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_network_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_group_network_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_group_port(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination port group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_port(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_group_port(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_group_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination port group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_port_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_group_port_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_group_mac(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_mac(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_group_mac(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_group_mac(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_mac_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_group_mac_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_group_domain(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination domain group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_domain(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_group_domain(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_group_domain(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination domain group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_domain_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_group_domain_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_source_group_remote(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set source remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_remote(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_source_group_remote(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_source_group_remote(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete source remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_remote_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_source_group_remote_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_destination_group_remote(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set destination remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_remote(chain, rule_number, group_name, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_destination_group_remote(chain, rule_number, group_name, is_custom)
+        return self._append("set", path)
 
     def delete_rule_destination_group_remote(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete destination remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_remote_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_destination_group_remote_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - State
@@ -429,43 +616,43 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_state_established(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable established state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_established(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_state_established(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_state_established(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Disable established state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_established_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_state_established_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_state_new(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable new state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_new(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_state_new(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_state_new(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Disable new state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_new_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_state_new_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_state_related(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable related state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_related(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_state_related(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_state_related(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Disable related state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_related_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_state_related_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_state_invalid(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Enable invalid state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_invalid(chain, rule_number, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_state_invalid(chain, rule_number, is_custom)
+        return self._append("set", path)
 
     def delete_rule_state_invalid(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Disable invalid state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_invalid_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_state_invalid_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - Interface
@@ -473,23 +660,23 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_inbound_interface(self, chain: str, rule_number: int, interface: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set inbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_inbound_interface(chain, rule_number, interface, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_inbound_interface(chain, rule_number, interface, is_custom)
+        return self._append("set", path)
 
     def delete_rule_inbound_interface(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete inbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_inbound_interface_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_inbound_interface_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_outbound_interface(self, chain: str, rule_number: int, interface: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set outbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_outbound_interface(chain, rule_number, interface, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_outbound_interface(chain, rule_number, interface, is_custom)
+        return self._append("set", path)
 
     def delete_rule_outbound_interface(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete outbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_outbound_interface_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_outbound_interface_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - Packet Modifications
@@ -497,33 +684,33 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_set_dscp(self, chain: str, rule_number: int, dscp: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set DSCP value."""
-        path = self.mappers[self.mapper_key].get_rule_set_dscp(chain, rule_number, dscp, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_set_dscp(chain, rule_number, dscp, is_custom)
+        return self._append("set", path)
 
     def delete_rule_set_dscp(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete DSCP value."""
-        path = self.mappers[self.mapper_key].get_rule_set_dscp_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_set_dscp_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_set_mark(self, chain: str, rule_number: int, mark: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set packet mark."""
-        path = self.mappers[self.mapper_key].get_rule_set_mark(chain, rule_number, mark, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_set_mark(chain, rule_number, mark, is_custom)
+        return self._append("set", path)
 
     def delete_rule_set_mark(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete packet mark."""
-        path = self.mappers[self.mapper_key].get_rule_set_mark_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_set_mark_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     def set_rule_set_ttl(self, chain: str, rule_number: int, ttl: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set TTL value."""
-        path = self.mappers[self.mapper_key].get_rule_set_ttl(chain, rule_number, ttl, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_set_ttl(chain, rule_number, ttl, is_custom)
+        return self._append("set", path)
 
     def delete_rule_set_ttl(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete TTL value."""
-        path = self.mappers[self.mapper_key].get_rule_set_ttl_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_set_ttl_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - TCP Flags
@@ -531,13 +718,13 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_tcp_flags(self, chain: str, rule_number: int, flag: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set TCP flags."""
-        path = self.mappers[self.mapper_key].get_rule_tcp_flags(chain, rule_number, flag, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_tcp_flags(chain, rule_number, flag, is_custom)
+        return self._append("set", path)
 
     def delete_rule_tcp_flags(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete TCP flags."""
-        path = self.mappers[self.mapper_key].get_rule_tcp_flags_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_tcp_flags_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - ICMP
@@ -545,13 +732,13 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_icmp_type_name(self, chain: str, rule_number: int, icmp_type: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set ICMP type name."""
-        path = self.mappers[self.mapper_key].get_rule_icmp_type_name(chain, rule_number, icmp_type, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_icmp_type_name(chain, rule_number, icmp_type, is_custom)
+        return self._append("set", path)
 
     def delete_rule_icmp_type_name(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete ICMP type name."""
-        path = self.mappers[self.mapper_key].get_rule_icmp_type_name_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_icmp_type_name_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
 
     # ========================================================================
     # Rule Properties - Jump Target
@@ -559,13 +746,61 @@ class FirewallIPv4BatchBuilder:
 
     def set_rule_jump_target(self, chain: str, rule_number: int, target: str, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Set jump target (for jump action)."""
-        path = self.mappers[self.mapper_key].get_rule_jump_target(chain, rule_number, target, is_custom)
-        return self.add_set(path)
+        path = self._g_rule_jump_target(chain, rule_number, target, is_custom)
+        return self._append("set", path)
 
     def delete_rule_jump_target(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
         """Delete jump target."""
-        path = self.mappers[self.mapper_key].get_rule_jump_target_path(chain, rule_number, is_custom)
-        return self.add_delete(path)
+        path = self._delete_path(self._g_rule_jump_target_path, chain, rule_number, is_custom)
+        return self._append("delete", path)
+
+    # ========================================================================
+    # Fused Rule Operations
+    # ========================================================================
+
+    def set_rule_properties(self, chain: str, rule_number: int, props: Dict[str, str], is_custom: bool = False) -> "FirewallIPv4BatchBuilder":
+        """
+        Set several value properties of one rule in a single call.
+
+        Keys are the set_rule_* method names without the prefix, e.g.
+        {"description": "web", "action": "accept", "source_address": "10.0.0.1"}.
+        Equivalent to calling each setter in turn.
+        """
+        unknown = props.keys() - _RULE_PROPERTY_GETTERS.keys()
+        if unknown:
+            raise ValueError(f"Unsupported rule properties: {', '.join(sorted(unknown))}")
+
+        append = self._append
+        for prop, value in props.items():
+            getter = getattr(self, _RULE_PROPERTY_GETTERS[prop])
+            append("set", getter(chain, rule_number, value, is_custom))
+        return self
+
+    def bulk_apply(self, ops: Iterable[Tuple[Any, ...]]) -> "FirewallIPv4BatchBuilder":
+        """
+        Apply a sequence of rule operations in one call.
+
+        Each op is (action, prop, *args): action is "set" or "delete", prop is
+        the set_rule_*/delete_rule_* method name without the prefix, and args
+        are that method's arguments, e.g. ("set", "action", "forward", 10,
+        "accept") or ("delete", "log", "web", 5, True). All ops are resolved
+        before any is applied, so an unknown one leaves the batch unchanged.
+        """
+        resolved = []
+        for action, prop, *args in ops:
+            getter = _BULK_RULE_GETTERS.get((action, prop))
+            if getter is None:
+                raise ValueError(f"Unsupported rule operation: {action} {prop}")
+            resolved.append((action, getattr(self, getter), args))
+
+        append = self._append
+        delete_path = self._delete_path
+        for action, getter, args in resolved:
+            if action == "set":
+                append("set", getter(*args))
+            else:
+                append("delete", delete_path(getter, *args))
+        return self
 
     # ========================================================================
     # Capabilities
@@ -577,85 +812,49 @@ class FirewallIPv4BatchBuilder:
 
         Returns feature flags indicating which operations are supported.
         """
-        # Check if version supports remote-group (VyOS 1.5+)
-        supports_remote_group = "1.5" in self.version or "latest" in self.version
-
-        return {
-            "version": self.version,
-            "features": {
-                "base_chains": {
-                    "supported": True,
-                    "description": "Forward, input, and output chains",
-                },
-                "custom_chains": {
-                    "supported": True,
-                    "description": "Custom named chains",
-                },
-                "basic_matching": {
-                    "supported": True,
-                    "description": "Source/destination IP, port, protocol matching",
-                },
-                "firewall_groups": {
-                    "supported": True,
-                    "description": "Address, network, and port group references",
-                },
-                "remote_group": {
-                    "supported": supports_remote_group,
-                    "description": "Remote group support (VyOS 1.5+ only)",
-                },
-                "connection_state": {
-                    "supported": True,
-                    "description": "Connection tracking (established, new, related, invalid)",
-                },
-                "tcp_flags": {
-                    "supported": True,
-                    "description": "TCP flag matching (syn, ack, fin, rst, etc.)",
-                },
-                "packet_modifications": {
-                    "supported": True,
-                    "description": "Set DSCP, mark, TTL",
-                },
-                "icmp_matching": {
-                    "supported": True,
-                    "description": "ICMP type and code matching",
-                },
-                "interface_matching": {
-                    "supported": True,
-                    "description": "Inbound/outbound interface matching",
-                },
-                "mac_matching": {
-                    "supported": True,
-                    "description": "Source MAC address matching",
-                },
-                "jump_action": {
-                    "supported": True,
-                    "description": "Jump to custom chains",
-                },
-            },
-            "actions": [
-                "accept",
-                "drop",
-                "reject",
-                "continue",
-                "return",
-                "jump",
-                "queue",
-                "synproxy"
-            ],
-            "states": [
-                "established",
-                "new",
-                "related",
-                "invalid"
-            ],
-            "tcp_flags": [
-                "syn",
-                "ack",
-                "fin",
-                "rst",
-                "psh",
-                "urg",
-                "ecn",
-                "cwr"
-            ],
-        }
+        return dict(_build_capabilities(self.version))
+
+
+# Capability features: (name, description, needs VyOS 1.5+)
+_FEATURES = (
+    ("base_chains", "Forward, input, and output chains", False),
+    ("custom_chains", "Custom named chains", False),
+    ("basic_matching", "Source/destination IP, port, protocol matching", False),
+    ("firewall_groups", "Address, network, and port group references", False),
+    ("remote_group", "Remote group support (VyOS 1.5+ only)", True),
+    ("connection_state", "Connection tracking (established, new, related, invalid)", False),
+    ("tcp_flags", "TCP flag matching (syn, ack, fin, rst, etc.)", False),
+    ("packet_modifications", "Set DSCP, mark, TTL", False),
+    ("icmp_matching", "ICMP type and code matching", False),
+    ("interface_matching", "Inbound/outbound interface matching", False),
+    ("mac_matching", "Source MAC address matching", False),
+    ("jump_action", "Jump to custom chains", False),
+)
+
+# Rule actions, connection states and TCP flags advertised in capabilities
+_ACTIONS = ("accept", "drop", "reject", "continue", "return", "jump", "queue", "synproxy")
+_STATES = ("established", "new", "related", "invalid")
+_TCP_FLAGS = ("syn", "ack", "fin", "rst", "psh", "urg", "ecn", "cwr")
+
+
+@lru_cache(maxsize=8)
+def _build_capabilities(version: str) -> Mapping[str, Any]:
+    """Build the read-only capabilities mapping for a VyOS version."""
+    # Remote-group matching needs VyOS 1.5+
+    is_15_plus = "1.5" in version or "latest" in version
+
+    capabilities = {
+        "version": version,
+        "features": {
+            name: {
+                "supported": is_15_plus or not needs_15,
+                "description": description,
+            }
+            for name, description, needs_15 in _FEATURES
+        },
+        "actions": _ACTIONS,
+        "states": _STATES,
+        "tcp_flags": _TCP_FLAGS,
+    }
+
+    return freeze_capabilities(capabilities)
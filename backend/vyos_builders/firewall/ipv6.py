@@ -5,21 +5,116 @@ Provides all batch operations for IPv6 firewall rules.
 Handles both base chains (forward, input, output) and custom named chains.
 """
 
-from typing import List, Dict, Any
+import json
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Mapping, Optional, Tuple
 from vyos_mappers import CommandMapperRegistry
+from vyos_mappers.firewall import FirewallIPv6Mapper
+from vyos_builders.capabilities import freeze_capabilities
+
+
+# Mapper path getters, bound per builder as ``_g_<name>`` (e.g.
+# get_rule_action -> _g_rule_action) so wrappers skip the mapper lookup.
+# The versioned mapper resolves methods through __getattr__, so the names
+# are taken from the base mapper class.
+_MAPPER_GETTERS = tuple(
+    name for name in dir(FirewallIPv6Mapper) if name.startswith("get_")
+)
+
+# Value-taking rule properties accepted by set_rule_property_bulk(), mapped
+# to the bound getter that builds their path (set_rule_<prop> -> _g_rule_<prop>)
+_RULE_PROPERTY_GETTERS = {
+    prop: "_g_rule_" + prop
+    for prop in (
+        "description",
+        "action",
+        "protocol",
+        "source_address",
+        "source_port",
+        "source_mac_address",
+        "source_geoip_country",
+        "source_group_address",
+        "source_group_network",
+        "source_group_port",
+        "source_group_mac",
+        "source_group_domain",
+        "source_group_remote",
+        "destination_address",
+        "destination_port",
+        "destination_geoip_country",
+        "destination_group_address",
+        "destination_group_network",
+        "destination_group_port",
+        "destination_group_mac",
+        "destination_group_domain",
+        "destination_group_remote",
+        "inbound_interface",
+        "outbound_interface",
+        "set_dscp",
+        "set_mark",
+        "set_hop_limit",
+        "tcp_flags",
+        "icmpv6_type_name",
+        "jump_target",
+    )
+}
+
+# Rule operations accepted by bulk_apply(): ("set", prop) resolves to the
+# getter behind set_rule_<prop>, ("delete", prop) to the one behind
+# delete_rule_<prop>
+_BULK_RULE_GETTERS = {
+    ("delete", name[9:-5]) if name.endswith("_path") else ("set", name[9:]): "_g_" + name[4:]
+    for name in _MAPPER_GETTERS
+    if name.startswith("get_rule_")
+}
+
+# Upper bound on memoized delete paths per builder
+_PATH_CACHE_SIZE = 4096
+
+# Built-in IPv6 filter chains; anything else is a custom (named) chain
+_BASE_CHAINS = frozenset(("forward", "input", "output"))
+
+# Operation names as sent to the VyOS configure endpoint
+_OP_SET = "set"
+_OP_DELETE = "delete"
 
 
 class FirewallIPv6BatchBuilder:
     """Complete batch builder for IPv6 firewall operations"""
 
-    def __init__(self, version: str):
-        """Initialize firewall IPv6 batch builder."""
+    __slots__ = (
+        "version",
+        "_ops",
+        "_paths",
+        "mappers",
+        "mapper_key",
+        "_mapper",
+        "_seen",
+        "_path_cache",
+    ) + tuple("_g_" + name[4:] for name in _MAPPER_GETTERS)
+
+    def __init__(self, version: str, dedup: bool = False):
+        """
+        Initialize firewall IPv6 batch builder.
+
+        With dedup, a 'set' is skipped when it repeats the last one under the
+        same parent path and no delete was added in between (see compact()).
+        """
         self.version = version
-        self._operations: List[Dict[str, Any]] = []
+        # Operations are kept as parallel lists of op names and (immutable,
+        # hashable) path tuples
+        self._ops: List[str] = []
+        self._paths: List[Tuple[str, ...]] = []
+        # With dedup, the last final element set under each parent path
+        self._seen: Optional[Dict[Tuple[str, ...], str]] = {} if dedup else None
 
         # Get firewall IPv6 mapper for this version
         self.mappers = CommandMapperRegistry.get_all_mappers(version)
         self.mapper_key = "firewall_ipv6"
+        self._mapper = self.mappers[self.mapper_key]
+        for name in _MAPPER_GETTERS:
+            setattr(self, "_g_" + name[4:], getattr(self._mapper, name))
+        self._path_cache: Dict[Tuple[Any, ...], Tuple[str, ...]] = {}
 
     # ========================================================================
     # Core Batch Operations
@@ -27,31 +122,116 @@ class FirewallIPv6BatchBuilder:
 
     def add_set(self, path: List[str]) -> "FirewallIPv6BatchBuilder":
         """Add a 'set' operation to the batch."""
-        if path:  # Only add if path is not empty
-            self._operations.append({"op": "set", "path": path})
+        if not path:  # Only add if path is not empty
+            return self
+        path = tuple(path)
+        seen = self._seen
+        if seen is not None:
+            parent = path[:-1]
+            if seen.get(parent) == path[-1]:
+                return self
+            seen[parent] = path[-1]
+        self._ops.append(_OP_SET)
+        self._paths.append(path)
         return self
 
     def add_delete(self, path: List[str]) -> "FirewallIPv6BatchBuilder":
         """Add a 'delete' operation to the batch."""
-        if path:
-            self._operations.append({"op": "delete", "path": path})
+        if not path:
+            return self
+        if self._seen is not None:
+            # A delete may undo earlier sets (including under a parent path)
+            self._seen.clear()
+        self._ops.append(_OP_DELETE)
+        self._paths.append(tuple(path))
         return self
 
+    def _delete_path(self, getter: Callable[..., List[str]], *args: Any) -> Tuple[str, ...]:
+        """
+        Return the delete path for getter(*args), memoized per builder.
+
+        Deleting a rule usually removes several of its properties, so the
+        same (chain, rule_number, is_custom) paths come up repeatedly.
+        """
+        key = (getter, args)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = tuple(getter(*args))
+            if len(self._path_cache) >= _PATH_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._path_cache[next(iter(self._path_cache))]
+            self._path_cache[key] = path
+        return path
+
     def clear(self) -> None:
         """Clear all operations from the batch."""
-        self._operations = []
+        self._ops.clear()
+        self._paths.clear()
+        if self._seen is not None:
+            self._seen.clear()
+
+    def compact(self) -> int:
+        """
+        Drop operations that cannot change the result of the batch.
+
+        A 'set' is dropped when the last set under the same parent path had
+        the same final element and no delete has come since. Single-value
+        leaves carry their value as the last path element, so a different
+        value in between (action accept -> drop -> accept) keeps the repeat.
+        Deletes are always kept. Returns the number of operations removed.
+        """
+        # Last final element set under each parent path
+        last: Dict[Tuple[str, ...], str] = {}
+        ops = []
+        paths = []
+        for op, path in zip(self._ops, self._paths):
+            if op == _OP_SET:
+                parent = path[:-1]
+                if last.get(parent) == path[-1]:
+                    continue
+                last[parent] = path[-1]
+            else:
+                last.clear()
+            ops.append(op)
+            paths.append(path)
+
+        removed = len(self._ops) - len(ops)
+        self._ops = ops
+        self._paths = paths
+        return removed
 
     def get_operations(self) -> List[Dict[str, Any]]:
         """Get the list of operations."""
-        return self._operations.copy()
+        return [{"op": op, "path": list(path)} for op, path in zip(self._ops, self._paths)]
+
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the operations as dicts without building a list."""
+        for op, path in zip(self._ops, self._paths):
+            yield {"op": op, "path": list(path)}
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the operations as a compact JSON array."""
+        # json encodes the stored path tuples as arrays, no list copies needed
+        return json.dumps(
+            [{"op": op, "path": path} for op, path in zip(self._ops, self._paths)],
+            separators=(",", ":"),
+        ).encode()
 
     def operation_count(self) -> int:
         """Get the number of operations in the batch."""
-        return len(self._operations)
+        return len(self._ops)
 
     def is_empty(self) -> bool:
         """Check if the batch is empty."""
-        return len(self._operations) == 0
+        return len(self._ops) == 0
+
+    def __len__(self) -> int:
+        """Number of operations; same as operation_count()."""
+        return len(self._ops)
+
+    def __bool__(self) -> bool:
+        """True if the batch has operations; the inverse of is_empty()."""
+        return bool(self._ops)
 
     # ========================================================================
     # Base Chain Rule Operations
@@ -59,22 +239,30 @@ class FirewallIPv6BatchBuilder:
 
     def set_base_chain_rule(self, chain: str, rule_number: int) -> "FirewallIPv6BatchBuilder":
         """Create a rule in a base chain (forward, input, output)."""
-        path = self.mappers[self.mapper_key].get_base_chain_rule(chain, rule_number)
+        if chain not in _BASE_CHAINS:
+            raise ValueError(f"Unknown base chain: {chain}")
+        path = self._g_base_chain_rule(chain, rule_number)
         return self.add_set(path)
 
     def delete_base_chain_rule(self, chain: str, rule_number: int) -> "FirewallIPv6BatchBuilder":
         """Delete a rule from a base chain."""
-        path = self.mappers[self.mapper_key].get_base_chain_rule_path(chain, rule_number)
+        if chain not in _BASE_CHAINS:
+            raise ValueError(f"Unknown base chain: {chain}")
+        path = self._delete_path(self._g_base_chain_rule_path, chain, rule_number)
         return self.add_delete(path)
 
     def set_base_chain_default_action(self, chain: str, action: str) -> "FirewallIPv6BatchBuilder":
         """Set default action for a base chain."""
-        path = self.mappers[self.mapper_key].get_base_chain_default_action(chain, action)
+        if chain not in _BASE_CHAINS:
+            raise ValueError(f"Unknown base chain: {chain}")
+        path = self._g_base_chain_default_action(chain, action)
         return self.add_set(path)
 
     def delete_base_chain_default_action(self, chain: str) -> "FirewallIPv6BatchBuilder":
         """Delete default action from a base chain."""
-        path = self.mappers[self.mapper_key].get_base_chain_default_action_path(chain)
+        if chain not in _BASE_CHAINS:
+            raise ValueError(f"Unknown base chain: {chain}")
+        path = self._delete_path(self._g_base_chain_default_action_path, chain)
         return self.add_delete(path)
 
     # ========================================================================
@@ -83,42 +271,42 @@ class FirewallIPv6BatchBuilder:
 
     def set_custom_chain(self, chain_name: str) -> "FirewallIPv6BatchBuilder":
         """Create a custom named chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain(chain_name)
+        path = self._g_custom_chain(chain_name)
         return self.add_set(path)
 
     def delete_custom_chain(self, chain_name: str) -> "FirewallIPv6BatchBuilder":
         """Delete a custom named chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_path(chain_name)
+        path = self._delete_path(self._g_custom_chain_path, chain_name)
         return self.add_delete(path)
 
     def set_custom_chain_description(self, chain_name: str, description: str) -> "FirewallIPv6BatchBuilder":
         """Set description for a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_description(chain_name, description)
+        path = self._g_custom_chain_description(chain_name, description)
         return self.add_set(path)
 
     def delete_custom_chain_description(self, chain_name: str) -> "FirewallIPv6BatchBuilder":
         """Delete description from a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_description_path(chain_name)
+        path = self._delete_path(self._g_custom_chain_description_path, chain_name)
         return self.add_delete(path)
 
     def set_custom_chain_default_action(self, chain_name: str, action: str) -> "FirewallIPv6BatchBuilder":
         """Set default action for a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_default_action(chain_name, action)
+        path = self._g_custom_chain_default_action(chain_name, action)
         return self.add_set(path)
 
     def delete_custom_chain_default_action(self, chain_name: str) -> "FirewallIPv6BatchBuilder":
         """Delete default action from a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_default_action_path(chain_name)
+        path = self._delete_path(self._g_custom_chain_default_action_path, chain_name)
         return self.add_delete(path)
 
     def set_custom_chain_rule(self, chain_name: str, rule_number: int) -> "FirewallIPv6BatchBuilder":
         """Create a rule in a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_rule(chain_name, rule_number)
+        path = self._g_custom_chain_rule(chain_name, rule_number)
         return self.add_set(path)
 
     def delete_custom_chain_rule(self, chain_name: str, rule_number: int) -> "FirewallIPv6BatchBuilder":
         """Delete a rule from a custom chain."""
-        path = self.mappers[self.mapper_key].get_custom_chain_rule_path(chain_name, rule_number)
+        path = self._delete_path(self._g_custom_chain_rule_path, chain_name, rule_number)
         return self.add_delete(path)
 
     # ========================================================================
@@ -127,52 +315,52 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_description(self, chain: str, rule_number: int, description: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set rule description."""
-        path = self.mappers[self.mapper_key].get_rule_description(chain, rule_number, description, is_custom)
+        path = self._g_rule_description(chain, rule_number, description, is_custom)
         return self.add_set(path)
 
     def delete_rule_description(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete rule description."""
-        path = self.mappers[self.mapper_key].get_rule_description_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_description_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_action(self, chain: str, rule_number: int, action: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set rule action (accept, drop, reject, continue, return, jump, queue, synproxy)."""
-        path = self.mappers[self.mapper_key].get_rule_action(chain, rule_number, action, is_custom)
+        path = self._g_rule_action(chain, rule_number, action, is_custom)
         return self.add_set(path)
 
     def delete_rule_action(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete rule action."""
-        path = self.mappers[self.mapper_key].get_rule_action_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_action_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_disable(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Disable a rule."""
-        path = self.mappers[self.mapper_key].get_rule_disable(chain, rule_number, is_custom)
+        path = self._g_rule_disable(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_disable(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable a rule (remove disable flag)."""
-        path = self.mappers[self.mapper_key].get_rule_disable_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_disable_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_log(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable logging for a rule."""
-        path = self.mappers[self.mapper_key].get_rule_log(chain, rule_number, is_custom)
+        path = self._g_rule_log(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_log(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Disable logging for a rule."""
-        path = self.mappers[self.mapper_key].get_rule_log_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_log_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_protocol(self, chain: str, rule_number: int, protocol: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set rule protocol."""
-        path = self.mappers[self.mapper_key].get_rule_protocol(chain, rule_number, protocol, is_custom)
+        path = self._g_rule_protocol(chain, rule_number, protocol, is_custom)
         return self.add_set(path)
 
     def delete_rule_protocol(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete rule protocol."""
-        path = self.mappers[self.mapper_key].get_rule_protocol_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_protocol_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -181,102 +369,102 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_source_address(self, chain: str, rule_number: int, address: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source address."""
-        path = self.mappers[self.mapper_key].get_rule_source_address(chain, rule_number, address, is_custom)
+        path = self._g_rule_source_address(chain, rule_number, address, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source address."""
-        path = self.mappers[self.mapper_key].get_rule_source_address_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_address_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_port(self, chain: str, rule_number: int, port: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source port."""
-        path = self.mappers[self.mapper_key].get_rule_source_port(chain, rule_number, port, is_custom)
+        path = self._g_rule_source_port(chain, rule_number, port, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source port."""
-        path = self.mappers[self.mapper_key].get_rule_source_port_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_port_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_mac_address(self, chain: str, rule_number: int, mac_address: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac_address(chain, rule_number, mac_address, is_custom)
+        path = self._g_rule_source_mac_address(chain, rule_number, mac_address, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_mac_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac_address_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_mac_address_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_geoip_country(self, chain: str, rule_number: int, country_code: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_country(chain, rule_number, country_code, is_custom)
+        path = self._g_rule_source_geoip_country(chain, rule_number, country_code, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_geoip_country(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_country_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_geoip_country_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable source GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_inverse(chain, rule_number, is_custom)
+        path = self._g_rule_source_geoip_inverse(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_inverse_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_geoip_inverse_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def delete_rule_source_geoip(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete the entire source GeoIP node (used when removing the last country)."""
-        path = self.mappers[self.mapper_key].get_rule_source_geoip_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_geoip_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def delete_rule_source(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete the entire source node (used when switching to 'any')."""
-        path = self.mappers[self.mapper_key].get_rule_source_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_group_address(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source address group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_address(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_source_group_address(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_group_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source address group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_address_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_group_address_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_group_network(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source network group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_network(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_source_group_network(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_group_network(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source network group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_network_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_group_network_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_group_port(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source port group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_port(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_source_group_port(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_group_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source port group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_port_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_group_port_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_mac(self, chain: str, rule_number: int, mac: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac(chain, rule_number, mac, is_custom)
+        path = self._g_rule_source_mac(chain, rule_number, mac, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_mac(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source MAC address."""
-        path = self.mappers[self.mapper_key].get_rule_source_mac_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_mac_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -285,142 +473,142 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_destination_address(self, chain: str, rule_number: int, address: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination address."""
-        path = self.mappers[self.mapper_key].get_rule_destination_address(chain, rule_number, address, is_custom)
+        path = self._g_rule_destination_address(chain, rule_number, address, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination address."""
-        path = self.mappers[self.mapper_key].get_rule_destination_address_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_address_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_port(self, chain: str, rule_number: int, port: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination port."""
-        path = self.mappers[self.mapper_key].get_rule_destination_port(chain, rule_number, port, is_custom)
+        path = self._g_rule_destination_port(chain, rule_number, port, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination port."""
-        path = self.mappers[self.mapper_key].get_rule_destination_port_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_port_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_geoip_country(self, chain: str, rule_number: int, country_code: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_country(chain, rule_number, country_code, is_custom)
+        path = self._g_rule_destination_geoip_country(chain, rule_number, country_code, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_geoip_country(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination GeoIP country code."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_country_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_geoip_country_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable destination GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_inverse(chain, rule_number, is_custom)
+        path = self._g_rule_destination_geoip_inverse(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_geoip_inverse(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination GeoIP inverse match."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_inverse_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_geoip_inverse_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def delete_rule_destination_geoip(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete the entire destination GeoIP node (used when removing the last country)."""
-        path = self.mappers[self.mapper_key].get_rule_destination_geoip_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_geoip_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def delete_rule_destination(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete the entire destination node (used when switching to 'any')."""
-        path = self.mappers[self.mapper_key].get_rule_destination_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_group_address(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination address group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_address(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_destination_group_address(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_group_address(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination address group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_address_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_group_address_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_group_network(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination network group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_network(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_destination_group_network(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_group_network(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination network group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_network_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_group_network_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_group_port(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination port group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_port(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_destination_group_port(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_group_port(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination port group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_port_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_group_port_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_group_mac(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_mac(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_source_group_mac(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_group_mac(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_mac_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_group_mac_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_group_mac(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_mac(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_destination_group_mac(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_group_mac(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination MAC group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_mac_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_group_mac_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_group_domain(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source domain group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_domain(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_source_group_domain(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_group_domain(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source domain group."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_domain_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_group_domain_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_group_domain(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination domain group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_domain(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_destination_group_domain(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_group_domain(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination domain group."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_domain_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_group_domain_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_source_group_remote(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set source remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_remote(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_source_group_remote(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_source_group_remote(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete source remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_source_group_remote_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_source_group_remote_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_destination_group_remote(self, chain: str, rule_number: int, group_name: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set destination remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_remote(chain, rule_number, group_name, is_custom)
+        path = self._g_rule_destination_group_remote(chain, rule_number, group_name, is_custom)
         return self.add_set(path)
 
     def delete_rule_destination_group_remote(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete destination remote group (VyOS 1.5+ only)."""
-        path = self.mappers[self.mapper_key].get_rule_destination_group_remote_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_destination_group_remote_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -429,42 +617,42 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_state_established(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable established state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_established(chain, rule_number, is_custom)
+        path = self._g_rule_state_established(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_state_established(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Disable established state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_established_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_state_established_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_state_new(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable new state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_new(chain, rule_number, is_custom)
+        path = self._g_rule_state_new(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_state_new(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Disable new state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_new_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_state_new_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_state_related(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable related state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_related(chain, rule_number, is_custom)
+        path = self._g_rule_state_related(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_state_related(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Disable related state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_related_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_state_related_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_state_invalid(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Enable invalid state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_invalid(chain, rule_number, is_custom)
+        path = self._g_rule_state_invalid(chain, rule_number, is_custom)
         return self.add_set(path)
 
     def delete_rule_state_invalid(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Disable invalid state matching."""
-        path = self.mappers[self.mapper_key].get_rule_state_invalid_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_state_invalid_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -473,22 +661,22 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_inbound_interface(self, chain: str, rule_number: int, interface: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set inbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_inbound_interface(chain, rule_number, interface, is_custom)
+        path = self._g_rule_inbound_interface(chain, rule_number, interface, is_custom)
         return self.add_set(path)
 
     def delete_rule_inbound_interface(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete inbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_inbound_interface_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_inbound_interface_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_outbound_interface(self, chain: str, rule_number: int, interface: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set outbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_outbound_interface(chain, rule_number, interface, is_custom)
+        path = self._g_rule_outbound_interface(chain, rule_number, interface, is_custom)
         return self.add_set(path)
 
     def delete_rule_outbound_interface(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete outbound interface."""
-        path = self.mappers[self.mapper_key].get_rule_outbound_interface_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_outbound_interface_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -497,32 +685,32 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_set_dscp(self, chain: str, rule_number: int, dscp: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set DSCP value."""
-        path = self.mappers[self.mapper_key].get_rule_set_dscp(chain, rule_number, dscp, is_custom)
+        path = self._g_rule_set_dscp(chain, rule_number, dscp, is_custom)
         return self.add_set(path)
 
     def delete_rule_set_dscp(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete DSCP value."""
-        path = self.mappers[self.mapper_key].get_rule_set_dscp_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_set_dscp_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_set_mark(self, chain: str, rule_number: int, mark: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set packet mark."""
-        path = self.mappers[self.mapper_key].get_rule_set_mark(chain, rule_number, mark, is_custom)
+        path = self._g_rule_set_mark(chain, rule_number, mark, is_custom)
         return self.add_set(path)
 
     def delete_rule_set_mark(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete packet mark."""
-        path = self.mappers[self.mapper_key].get_rule_set_mark_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_set_mark_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     def set_rule_set_hop_limit(self, chain: str, rule_number: int, hop_limit: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set hop-limit value (IPv6 equivalent of TTL)."""
-        path = self.mappers[self.mapper_key].get_rule_set_hop_limit(chain, rule_number, hop_limit, is_custom)
+        path = self._g_rule_set_hop_limit(chain, rule_number, hop_limit, is_custom)
         return self.add_set(path)
 
     def delete_rule_set_hop_limit(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete hop-limit value."""
-        path = self.mappers[self.mapper_key].get_rule_set_hop_limit_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_set_hop_limit_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -531,12 +719,12 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_tcp_flags(self, chain: str, rule_number: int, flag: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set TCP flags."""
-        path = self.mappers[self.mapper_key].get_rule_tcp_flags(chain, rule_number, flag, is_custom)
+        path = self._g_rule_tcp_flags(chain, rule_number, flag, is_custom)
         return self.add_set(path)
 
     def delete_rule_tcp_flags(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete TCP flags."""
-        path = self.mappers[self.mapper_key].get_rule_tcp_flags_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_tcp_flags_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -545,12 +733,12 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_icmpv6_type_name(self, chain: str, rule_number: int, icmpv6_type: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set ICMPv6 type name."""
-        path = self.mappers[self.mapper_key].get_rule_icmpv6_type_name(chain, rule_number, icmpv6_type, is_custom)
+        path = self._g_rule_icmpv6_type_name(chain, rule_number, icmpv6_type, is_custom)
         return self.add_set(path)
 
     def delete_rule_icmpv6_type_name(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete ICMPv6 type name."""
-        path = self.mappers[self.mapper_key].get_rule_icmpv6_type_name_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_icmpv6_type_name_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
     # ========================================================================
@@ -559,14 +747,96 @@ class FirewallIPv6BatchBuilder:
 
     def set_rule_jump_target(self, chain: str, rule_number: int, target: str, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Set jump target (for jump action)."""
-        path = self.mappers[self.mapper_key].get_rule_jump_target(chain, rule_number, target, is_custom)
+        path = self._g_rule_jump_target(chain, rule_number, target, is_custom)
         return self.add_set(path)
 
     def delete_rule_jump_target(self, chain: str, rule_number: int, is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
         """Delete jump target."""
-        path = self.mappers[self.mapper_key].get_rule_jump_target_path(chain, rule_number, is_custom)
+        path = self._delete_path(self._g_rule_jump_target_path, chain, rule_number, is_custom)
         return self.add_delete(path)
 
+    # ========================================================================
+    # Bulk Rule Operations
+    # ========================================================================
+
+    def set_rule_properties(self, chain: str, rule_number: int, props: Dict[str, str], is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
+        """
+        Set several value properties of one rule in a single call.
+
+        Keys are the set_rule_* method names without the prefix, e.g.
+        {"description": "web", "action": "accept", "set_hop_limit": "64"}.
+        Equivalent to calling each setter in turn.
+        """
+        unknown = props.keys() - _RULE_PROPERTY_GETTERS.keys()
+        if unknown:
+            raise ValueError(f"Unsupported rule properties: {', '.join(sorted(unknown))}")
+
+        paths = [
+            tuple(getattr(self, _RULE_PROPERTY_GETTERS[prop])(chain, rule_number, value, is_custom))
+            for prop, value in props.items()
+        ]
+        if self._seen is not None:
+            for path in paths:
+                self.add_set(path)
+            return self
+
+        self._ops.extend([_OP_SET] * len(paths))
+        self._paths.extend(paths)
+        return self
+
+    def set_rule_property_bulk(self, chain: str, rule_numbers: Iterable[int], prop: str, values: Iterable[str], is_custom: bool = False) -> "FirewallIPv6BatchBuilder":
+        """
+        Set one property on many rules of a chain.
+
+        rule_numbers and values are paired up, e.g. ([10, 20], "action",
+        ["accept", "drop"]); prop is the set_rule_* method name without the
+        prefix. Equivalent to calling that setter once per rule.
+        """
+        getter_name = _RULE_PROPERTY_GETTERS.get(prop)
+        if getter_name is None:
+            raise ValueError(f"Unsupported rule property: {prop}")
+
+        getter = getattr(self, getter_name)
+        paths = [
+            tuple(getter(chain, rule_number, value, is_custom))
+            for rule_number, value in zip(rule_numbers, values, strict=True)
+        ]
+        if self._seen is not None:
+            for path in paths:
+                self.add_set(path)
+            return self
+
+        self._ops.extend([_OP_SET] * len(paths))
+        self._paths.extend(paths)
+        return self
+
+    def bulk_apply(self, ops: Iterable[Tuple[Any, ...]]) -> "FirewallIPv6BatchBuilder":
+        """
+        Apply a sequence of rule operations in one call.
+
+        Each op is (action, prop, *args): action is "set" or "delete", prop is
+        the set_rule_*/delete_rule_* method name without the prefix, and args
+        are that method's arguments, e.g. ("set", "action", "forward", 10,
+        "accept") or ("delete", "log", "web", 5, True). All ops are resolved
+        before any is applied, so an unknown one leaves the batch unchanged.
+        """
+        resolved = []
+        for action, prop, *args in ops:
+            getter = _BULK_RULE_GETTERS.get((action, prop))
+            if getter is None:
+                raise ValueError(f"Unsupported rule operation: {action} {prop}")
+            resolved.append((action, getattr(self, getter), args))
+
+        add_set = self.add_set
+        add_delete = self.add_delete
+        delete_path = self._delete_path
+        for action, getter, args in resolved:
+            if action == "set":
+                add_set(getter(*args))
+            else:
+                add_delete(delete_path(getter, *args))
+        return self
+
     # ========================================================================
     # Capabilities
     # ========================================================================
@@ -577,85 +847,93 @@ class FirewallIPv6BatchBuilder:
 
         Returns feature flags indicating which operations are supported.
         """
-        # Check if version supports remote-group (VyOS 1.5+)
-        supports_remote_group = "1.5" in self.version or "latest" in self.version
-
-        return {
-            "version": self.version,
-            "features": {
-                "base_chains": {
-                    "supported": True,
-                    "description": "Forward, input, and output chains",
-                },
-                "custom_chains": {
-                    "supported": True,
-                    "description": "Custom named chains",
-                },
-                "basic_matching": {
-                    "supported": True,
-                    "description": "Source/destination IPv6 address, port, protocol matching",
-                },
-                "firewall_groups": {
-                    "supported": True,
-                    "description": "Address, network, and port group references",
-                },
-                "remote_group": {
-                    "supported": supports_remote_group,
-                    "description": "Remote group support (VyOS 1.5+ only)",
-                },
-                "connection_state": {
-                    "supported": True,
-                    "description": "Connection tracking (established, new, related, invalid)",
-                },
-                "tcp_flags": {
-                    "supported": True,
-                    "description": "TCP flag matching (syn, ack, fin, rst, etc.)",
-                },
-                "packet_modifications": {
-                    "supported": True,
-                    "description": "Set DSCP, mark, hop-limit",
-                },
-                "icmpv6_matching": {
-                    "supported": True,
-                    "description": "ICMPv6 type matching",
-                },
-                "interface_matching": {
-                    "supported": True,
-                    "description": "Inbound/outbound interface matching",
-                },
-                "mac_matching": {
-                    "supported": True,
-                    "description": "Source MAC address matching",
-                },
-                "jump_action": {
-                    "supported": True,
-                    "description": "Jump to custom chains",
-                },
+        return dict(_build_capabilities(self.version))
+
+
+@lru_cache(maxsize=8)
+def _build_capabilities(version: str) -> Mapping[str, Any]:
+    """Build the read-only capabilities mapping for a VyOS version."""
+    # Check if version supports remote-group (VyOS 1.5+)
+    supports_remote_group = "1.5" in version or "latest" in version
+
+    capabilities = {
+        "version": version,
+        "features": {
+            "base_chains": {
+                "supported": True,
+                "description": "Forward, input, and output chains",
+            },
+            "custom_chains": {
+                "supported": True,
+                "description": "Custom named chains",
+            },
+            "basic_matching": {
+                "supported": True,
+                "description": "Source/destination IPv6 address, port, protocol matching",
+            },
+            "firewall_groups": {
+                "supported": True,
+                "description": "Address, network, and port group references",
+            },
+            "remote_group": {
+                "supported": supports_remote_group,
+                "description": "Remote group support (VyOS 1.5+ only)",
+            },
+            "connection_state": {
+                "supported": True,
+                "description": "Connection tracking (established, new, related, invalid)",
+            },
+            "tcp_flags": {
+                "supported": True,
+                "description": "TCP flag matching (syn, ack, fin, rst, etc.)",
+            },
+            "packet_modifications": {
+                "supported": True,
+                "description": "Set DSCP, mark, hop-limit",
+            },
+            "icmpv6_matching": {
+                "supported": True,
+                "description": "ICMPv6 type matching",
+            },
+            "interface_matching": {
+                "supported": True,
+                "description": "Inbound/outbound interface matching",
+            },
+            "mac_matching": {
+                "supported": True,
+                "description": "Source MAC address matching",
+            },
+            "jump_action": {
+                "supported": True,
+                "description": "Jump to custom chains",
             },
-            "actions": [
-                "accept",
-                "drop",
-                "reject",
-                "continue",
-                "return",
-                "jump",
-                "queue",
-                "synproxy"
-            ],
-            "states": [
-                "established",
-                "new",
-                "related",
-                "invalid"
-            ],
-            "tcp_flags": [
-                "syn",
-                "ack",
-                "fin",
-                "rst",
-                "psh",
-                "urg",
-                "ecn",
-                "cwr"
-            ],
-        }
+        },
+        "actions": [
+            "accept",
+            "drop",
+            "reject",
+            "continue",
+            "return",
+            "jump",
+            "queue",
+            "synproxy"
+        ],
+        "states": [
+            "established",
+            "new",
+            "related",
+            "invalid"
+        ],
+        "tcp_flags": [
+            "syn",
+            "ack",
+            "fin",
+            "rst",
+            "psh",
+            "urg",
+            "ecn",
+            "cwr"
+        ],
+    }
+
+    return freeze_capabilities(capabilities)
@@ -5,8 +5,19 @@ Provides all batch operations for VyOS local route policy configuration.
 Handles both IPv4 (local-route) and IPv6 (local-route6) rules.
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Iterator, List, Dict, Any, Mapping, Tuple
 from vyos_mappers import CommandMapperRegistry
+from vyos_mappers.local_route import LocalRouteMapper
+from vyos_builders.capabilities import freeze_capabilities
+
+# Mapper path getters, bound per builder as ``_g_<name>`` (e.g.
+# get_local_route_rule -> _g_local_route_rule) so wrappers skip the mapper
+# lookup. The versioned mapper resolves methods through __getattr__, so the
+# names are taken from the base mapper class.
+_MAPPER_GETTERS = tuple(
+    name for name in dir(LocalRouteMapper) if name.startswith("get_")
+)
 
 
 class LocalRouteBatchBuilder:
@@ -15,11 +26,14 @@ class LocalRouteBatchBuilder:
     def __init__(self, version: str):
         """Initialize builder with VyOS version."""
         self.version = version
-        self._operations: List[Dict[str, Any]] = []
+        self._operations: List[Tuple[str, List[str]]] = []
 
         # Get mapper for this version
         self.mappers = CommandMapperRegistry.get_all_mappers(version)
         self.mapper_key = "local_route"
+        self._mapper = self.mappers[self.mapper_key]
+        for name in _MAPPER_GETTERS:
+            setattr(self, "_g_" + name[4:], getattr(self._mapper, name))
 
     # ========================================================================
     # Core Batch Operations
@@ -28,13 +42,13 @@ class LocalRouteBatchBuilder:
     def add_set(self, path: List[str]) -> "LocalRouteBatchBuilder":
         """Add a 'set' operation to the batch."""
         if path:  # Only add if path is not empty
-            self._operations.append({"op": "set", "path": path})
+            self._operations.append(("set", path))
         return self
 
     def add_delete(self, path: List[str]) -> "LocalRouteBatchBuilder":
         """Add a 'delete' operation to the batch."""
         if path:
-            self._operations.append({"op": "delete", "path": path})
+            self._operations.append(("delete", path))
         return self
 
     def clear(self) -> None:
@@ -43,7 +57,12 @@ class LocalRouteBatchBuilder:
 
     def get_operations(self) -> List[Dict[str, Any]]:
         """Get the list of operations."""
-        return self._operations.copy()
+        return [{"op": op, "path": path} for op, path in self._operations]
+
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the operations as dicts without building a list."""
+        for op, path in self._operations:
+            yield {"op": op, "path": path}
 
     def operation_count(self) -> int:
         """Get the number of operations in the batch."""
@@ -53,19 +72,31 @@ class LocalRouteBatchBuilder:
         """Check if the batch is empty."""
         return len(self._operations) == 0
 
+    def __len__(self) -> int:
+        """Number of operations; same as operation_count()."""
+        return len(self._operations)
+
+    def __bool__(self) -> bool:
+        """True if the batch has operations; the inverse of is_empty()."""
+        return bool(self._operations)
+
     # ========================================================================
     # IPv4 Local Route - Rule Operations
     # ========================================================================
 
     def set_local_route_rule(self, rule_number: int) -> "LocalRouteBatchBuilder":
         """Create IPv4 local route rule."""
-        path = self.mappers[self.mapper_key].get_local_route_rule(rule_number)
-        return self.add_set(path)
+        path = self._g_local_route_rule(rule_number)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route_rule(self, rule_number: int) -> "LocalRouteBatchBuilder":
         """Delete IPv4 local route rule."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_local_route_rule_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     # ========================================================================
     # IPv4 Local Route - Rule Properties
@@ -75,91 +106,91 @@ class LocalRouteBatchBuilder:
         self, rule_number: int, source: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv4 rule source address/prefix."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_source(
-            rule_number, source
-        )
-        return self.add_set(path)
+        path = self._g_local_route_rule_source(rule_number, source)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route_rule_source(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv4 rule source."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_source_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route_rule_source_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route_rule_destination(
         self, rule_number: int, destination: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv4 rule destination address/prefix."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_destination(
-            rule_number, destination
-        )
-        return self.add_set(path)
+        path = self._g_local_route_rule_destination(rule_number, destination)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route_rule_destination(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv4 rule destination."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_destination_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route_rule_destination_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route_rule_inbound_interface(
         self, rule_number: int, interface: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv4 rule inbound interface."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_inbound_interface(
-            rule_number, interface
-        )
-        return self.add_set(path)
+        path = self._g_local_route_rule_inbound_interface(rule_number, interface)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route_rule_inbound_interface(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv4 rule inbound interface."""
-        path = self.mappers[
-            self.mapper_key
-        ].get_local_route_rule_inbound_interface_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_local_route_rule_inbound_interface_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route_rule_set_table(
         self, rule_number: int, table: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv4 rule routing table."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_set_table(
-            rule_number, table
-        )
-        return self.add_set(path)
+        path = self._g_local_route_rule_set_table(rule_number, table)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route_rule_set_table(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv4 rule routing table."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_set_table_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route_rule_set_table_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route_rule_set_vrf(
         self, rule_number: int, vrf: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv4 rule VRF (VyOS 1.5+)."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_set_vrf(
-            rule_number, vrf
-        )
-        return self.add_set(path)
+        path = self._g_local_route_rule_set_vrf(rule_number, vrf)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route_rule_set_vrf(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv4 rule VRF."""
-        path = self.mappers[self.mapper_key].get_local_route_rule_set_vrf_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route_rule_set_vrf_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     # ========================================================================
     # IPv6 Local Route - Rule Operations
@@ -167,13 +198,17 @@ class LocalRouteBatchBuilder:
 
     def set_local_route6_rule(self, rule_number: int) -> "LocalRouteBatchBuilder":
         """Create IPv6 local route rule."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule(rule_number)
-        return self.add_set(path)
+        path = self._g_local_route6_rule(rule_number)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route6_rule(self, rule_number: int) -> "LocalRouteBatchBuilder":
         """Delete IPv6 local route rule."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_local_route6_rule_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     # ========================================================================
     # IPv6 Local Route - Rule Properties
@@ -183,91 +218,91 @@ class LocalRouteBatchBuilder:
         self, rule_number: int, source: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv6 rule source address/prefix."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_source(
-            rule_number, source
-        )
-        return self.add_set(path)
+        path = self._g_local_route6_rule_source(rule_number, source)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route6_rule_source(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv6 rule source."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_source_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route6_rule_source_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route6_rule_destination(
         self, rule_number: int, destination: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv6 rule destination address/prefix."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_destination(
-            rule_number, destination
-        )
-        return self.add_set(path)
+        path = self._g_local_route6_rule_destination(rule_number, destination)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route6_rule_destination(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv6 rule destination."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_destination_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route6_rule_destination_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route6_rule_inbound_interface(
         self, rule_number: int, interface: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv6 rule inbound interface."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_inbound_interface(
-            rule_number, interface
-        )
-        return self.add_set(path)
+        path = self._g_local_route6_rule_inbound_interface(rule_number, interface)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route6_rule_inbound_interface(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv6 rule inbound interface."""
-        path = self.mappers[
-            self.mapper_key
-        ].get_local_route6_rule_inbound_interface_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_local_route6_rule_inbound_interface_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route6_rule_set_table(
         self, rule_number: int, table: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv6 rule routing table."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_set_table(
-            rule_number, table
-        )
-        return self.add_set(path)
+        path = self._g_local_route6_rule_set_table(rule_number, table)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route6_rule_set_table(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv6 rule routing table."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_set_table_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route6_rule_set_table_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     def set_local_route6_rule_set_vrf(
         self, rule_number: int, vrf: str
     ) -> "LocalRouteBatchBuilder":
         """Set IPv6 rule VRF (VyOS 1.5+)."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_set_vrf(
-            rule_number, vrf
-        )
-        return self.add_set(path)
+        path = self._g_local_route6_rule_set_vrf(rule_number, vrf)
+        if path:
+            self._operations.append(("set", path))
+        return self
 
     def delete_local_route6_rule_set_vrf(
         self, rule_number: int
     ) -> "LocalRouteBatchBuilder":
         """Delete IPv6 rule VRF."""
-        path = self.mappers[self.mapper_key].get_local_route6_rule_set_vrf_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_local_route6_rule_set_vrf_path(rule_number)
+        if path:
+            self._operations.append(("delete", path))
+        return self
 
     # ========================================================================
     # Capabilities
@@ -275,39 +310,47 @@ class LocalRouteBatchBuilder:
 
     def get_capabilities(self) -> Dict[str, Any]:
         """Get capabilities for the current VyOS version."""
-        # VRF support is only available in VyOS 1.5+
-        supports_vrf = "1.5" in self.version or "latest" in self.version
-
-        return {
-            "version": self.version,
-            "features": {
-                "ipv4_local_route": {
-                    "supported": True,
-                    "description": "IPv4 policy-based routing",
-                },
-                "ipv6_local_route": {
-                    "supported": True,
-                    "description": "IPv6 policy-based routing",
-                },
-                "source_matching": {
-                    "supported": True,
-                    "description": "Match based on source address/prefix",
-                },
-                "destination_matching": {
-                    "supported": True,
-                    "description": "Match based on destination address/prefix",
-                },
-                "inbound_interface_matching": {
-                    "supported": True,
-                    "description": "Match based on inbound interface",
-                },
-                "routing_table_selection": {
-                    "supported": True,
-                    "description": "Route to specific routing table (1-200 or main)",
-                },
-                "vrf_support": {
-                    "supported": supports_vrf,
-                    "description": "Route to specific VRF instance (VyOS 1.5+ only)",
-                },
+        return dict(_build_capabilities(self.version))
+
+
+@lru_cache(maxsize=8)
+def _build_capabilities(version: str) -> Mapping[str, Any]:
+    """Build the read-only capabilities mapping for a VyOS version."""
+    # VRF support is only available in VyOS 1.5+
+    supports_vrf = "1.5" in version or "latest" in version
+
+    capabilities = {
+        "version": version,
+        "features": {
+            "ipv4_local_route": {
+                "supported": True,
+                "description": "IPv4 policy-based routing",
             },
-        }
+            "ipv6_local_route": {
+                "supported": True,
+                "description": "IPv6 policy-based routing",
+            },
+            "source_matching": {
+                "supported": True,
+                "description": "Match based on source address/prefix",
+            },
+            "destination_matching": {
+                "supported": True,
+                "description": "Match based on destination address/prefix",
+            },
+            "inbound_interface_matching": {
+                "supported": True,
+                "description": "Match based on inbound interface",
+            },
+            "routing_table_selection": {
+                "supported": True,
+                "description": "Route to specific routing table (1-200 or main)",
+            },
+            "vrf_support": {
+                "supported": supports_vrf,
+                "description": "Route to specific VRF instance (VyOS 1.5+ only)",
+            },
+        },
+    }
+
+    return freeze_capabilities(capabilities)
@@ -4,21 +4,54 @@ NAT Batch Builder
 Provides all NAT batch operations following the standard pattern.
 """
 
-from typing import List, Dict, Any
+import json
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Any, Mapping, Tuple
 from vyos_mappers import CommandMapperRegistry
+from vyos_mappers.nat import NATMapper
+from vyos_builders.capabilities import freeze_capabilities
+
+
+# Mapper path getters, bound per builder as ``_g_<name>`` (e.g.
+# get_source_rule -> _g_source_rule) so wrappers skip the mapper lookup
+_MAPPER_GETTERS = tuple(name for name in dir(NATMapper) if name.startswith("get_"))
+
+# Bound getters behind each set_*/delete_* wrapper, keyed by (action, name)
+# with the method prefix stripped. Deletes use the <getter>_path variant when
+# the mapper has one; flag nodes (disable, exclude, log, ...) and whole rules
+# are deleted through the same path they are set with.
+_BULK_GETTERS: Dict[Tuple[str, str], str] = {}
+for _name in _MAPPER_GETTERS:
+    if not _name.endswith("_path"):
+        _BULK_GETTERS["set", _name[4:]] = "_g_" + _name[4:]
+        _BULK_GETTERS["delete", _name[4:]] = "_g_" + (
+            _name[4:] + "_path" if _name + "_path" in _MAPPER_GETTERS else _name[4:]
+        )
+del _name
 
 
 class NATBatchBuilder:
     """Complete batch builder for NAT operations"""
 
+    __slots__ = (
+        "version",
+        "_operations",
+        "mappers",
+        "mapper_key",
+        "_mapper",
+    ) + tuple("_g_" + name[4:] for name in _MAPPER_GETTERS)
+
     def __init__(self, version: str):
         """Initialize NAT batch builder."""
         self.version = version
-        self._operations: List[Dict[str, Any]] = []
+        self._operations: List[Tuple[str, List[str]]] = []
 
         # Get NAT mapper for this version
         self.mappers = CommandMapperRegistry.get_all_mappers(version)
         self.mapper_key = "nat"
+        self._mapper = self.mappers[self.mapper_key]
+        for name in _MAPPER_GETTERS:
+            setattr(self, "_g_" + name[4:], getattr(self._mapper, name))
 
     # ========================================================================
     # Core Batch Operations
@@ -26,12 +59,12 @@ class NATBatchBuilder:
 
     def add_set(self, path: List[str]) -> "NATBatchBuilder":
         """Add a 'set' operation to the batch."""
-        self._operations.append({"op": "set", "path": path})
+        self._operations.append(("set", path))
         return self
 
     def add_delete(self, path: List[str]) -> "NATBatchBuilder":
         """Add a 'delete' operation to the batch."""
-        self._operations.append({"op": "delete", "path": path})
+        self._operations.append(("delete", path))
         return self
 
     def clear(self) -> None:
@@ -40,7 +73,19 @@ class NATBatchBuilder:
 
     def get_operations(self) -> List[Dict[str, Any]]:
         """Get the list of operations."""
-        return self._operations.copy()
+        return [{"op": op, "path": path} for op, path in self._operations]
+
+    def iter_operations(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the operations as dicts without building a list."""
+        for op, path in self._operations:
+            yield {"op": op, "path": path}
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the operations as a compact JSON array."""
+        return json.dumps(
+            [{"op": op, "path": path} for op, path in self._operations],
+            separators=(",", ":"),
+        ).encode()
 
     def operation_count(self) -> int:
         """Get the number of operations in the batch."""
@@ -50,273 +95,277 @@ class NATBatchBuilder:
         """Check if the batch is empty."""
         return len(self._operations) == 0
 
+    def __len__(self) -> int:
+        """Number of operations; same as operation_count()."""
+        return len(self._operations)
+
+    def __bool__(self) -> bool:
+        """True if the batch has operations; the inverse of is_empty()."""
+        return bool(self._operations)
+
     # ========================================================================
     # Source NAT Rule Operations
     # ========================================================================
 
     def set_source_rule(self, rule_number: int) -> "NATBatchBuilder":
         """Create source NAT rule."""
-        path = self.mappers[self.mapper_key].get_source_rule(rule_number)
-        return self.add_set(path)
+        path = self._g_source_rule(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source NAT rule."""
-        path = self.mappers[self.mapper_key].get_source_rule(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_packet_type(
         self, rule_number: int, packet_type: str
     ) -> "NATBatchBuilder":
         """Set source rule packet-type."""
-        path = self.mappers[self.mapper_key].get_source_rule_packet_type(
-            rule_number, packet_type
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_packet_type(rule_number, packet_type)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_packet_type(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule packet-type."""
-        path = self.mappers[self.mapper_key].get_source_rule_packet_type_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_packet_type_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_description(
         self, rule_number: int, description: str
     ) -> "NATBatchBuilder":
         """Set source rule description."""
-        path = self.mappers[self.mapper_key].get_source_rule_description(
-            rule_number, description
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_description(rule_number, description)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_description(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule description."""
-        path = self.mappers[self.mapper_key].get_source_rule_description_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_description_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_destination_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set source rule destination address."""
-        path = self.mappers[self.mapper_key].get_source_rule_destination_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_destination_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_destination_address(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete source rule destination address."""
-        path = self.mappers[self.mapper_key].get_source_rule_destination_address_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_destination_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_destination_group(
         self, rule_number: int, group_type: str, group_name: str
     ) -> "NATBatchBuilder":
         """Set source rule destination group."""
-        path = self.mappers[self.mapper_key].get_source_rule_destination_group(
+        path = self._g_source_rule_destination_group(
             rule_number, group_type, group_name
         )
-        return self.add_set(path)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_destination_group(
         self, rule_number: int, group_type: str
     ) -> "NATBatchBuilder":
         """Delete source rule destination group."""
-        path = self.mappers[self.mapper_key].get_source_rule_destination_group_path(
-            rule_number, group_type
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_destination_group_path(rule_number, group_type)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_destination_port(
         self, rule_number: int, port: str
     ) -> "NATBatchBuilder":
         """Set source rule destination port."""
-        path = self.mappers[self.mapper_key].get_source_rule_destination_port(
-            rule_number, port
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_destination_port(rule_number, port)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_destination_port(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule destination port."""
-        path = self.mappers[self.mapper_key].get_source_rule_destination_port_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_destination_port_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_disable(self, rule_number: int) -> "NATBatchBuilder":
         """Set source rule disable flag."""
-        path = self.mappers[self.mapper_key].get_source_rule_disable(rule_number)
-        return self.add_set(path)
+        path = self._g_source_rule_disable(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_disable(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule disable flag (enable the rule)."""
-        path = self.mappers[self.mapper_key].get_source_rule_disable(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_disable(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_exclude(self, rule_number: int) -> "NATBatchBuilder":
         """Set source rule exclude flag."""
-        path = self.mappers[self.mapper_key].get_source_rule_exclude(rule_number)
-        return self.add_set(path)
+        path = self._g_source_rule_exclude(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_exclude(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule exclude flag."""
-        path = self.mappers[self.mapper_key].get_source_rule_exclude(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_exclude(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_load_balance_hash(
         self, rule_number: int, hash_type: str
     ) -> "NATBatchBuilder":
         """Set source rule load-balance hash."""
-        path = self.mappers[self.mapper_key].get_source_rule_load_balance_hash(
-            rule_number, hash_type
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_load_balance_hash(rule_number, hash_type)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_load_balance_hash(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule load-balance hash."""
-        path = self.mappers[self.mapper_key].get_source_rule_load_balance_hash_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_load_balance_hash_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_load_balance_backend(
         self, rule_number: int, backend: str
     ) -> "NATBatchBuilder":
         """Set source rule load-balance backend."""
-        path = self.mappers[self.mapper_key].get_source_rule_load_balance_backend(
-            rule_number, backend
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_load_balance_backend(rule_number, backend)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_load_balance_backend(
         self, rule_number: int, backend: str
     ) -> "NATBatchBuilder":
         """Delete source rule load-balance backend."""
-        path = self.mappers[self.mapper_key].get_source_rule_load_balance_backend_path(
-            rule_number, backend
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_load_balance_backend_path(rule_number, backend)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_log(self, rule_number: int) -> "NATBatchBuilder":
         """Set source rule log flag."""
-        path = self.mappers[self.mapper_key].get_source_rule_log(rule_number)
-        return self.add_set(path)
+        path = self._g_source_rule_log(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_log(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule log flag."""
-        path = self.mappers[self.mapper_key].get_source_rule_log(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_log(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_outbound_interface_name(
         self, rule_number: int, interface: str
     ) -> "NATBatchBuilder":
         """Set source rule outbound-interface name."""
-        path = self.mappers[self.mapper_key].get_source_rule_outbound_interface_name(
-            rule_number, interface
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_outbound_interface_name(rule_number, interface)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_outbound_interface_name(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete source rule outbound-interface name."""
-        path = self.mappers[self.mapper_key].get_source_rule_outbound_interface_name_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_outbound_interface_name_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_outbound_interface_group(
         self, rule_number: int, group: str
     ) -> "NATBatchBuilder":
         """Set source rule outbound-interface group."""
-        path = self.mappers[self.mapper_key].get_source_rule_outbound_interface_group(
-            rule_number, group
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_outbound_interface_group(rule_number, group)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_outbound_interface_group(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete source rule outbound-interface group."""
-        path = self.mappers[self.mapper_key].get_source_rule_outbound_interface_group_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_outbound_interface_group_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_protocol(
         self, rule_number: int, protocol: str
     ) -> "NATBatchBuilder":
         """Set source rule protocol."""
-        path = self.mappers[self.mapper_key].get_source_rule_protocol(rule_number, protocol)
-        return self.add_set(path)
+        path = self._g_source_rule_protocol(rule_number, protocol)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_protocol(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule protocol."""
-        path = self.mappers[self.mapper_key].get_source_rule_protocol_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_protocol_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_source_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set source rule source address."""
-        path = self.mappers[self.mapper_key].get_source_rule_source_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_source_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_source_address(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule source address."""
-        path = self.mappers[self.mapper_key].get_source_rule_source_address_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_source_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_source_group(
         self, rule_number: int, group_type: str, group_name: str
     ) -> "NATBatchBuilder":
         """Set source rule source group."""
-        path = self.mappers[self.mapper_key].get_source_rule_source_group(
-            rule_number, group_type, group_name
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_source_group(rule_number, group_type, group_name)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_source_group(
         self, rule_number: int, group_type: str
     ) -> "NATBatchBuilder":
         """Delete source rule source group."""
-        path = self.mappers[self.mapper_key].get_source_rule_source_group_path(
-            rule_number, group_type
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_source_group_path(rule_number, group_type)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_source_port(
         self, rule_number: int, port: str
     ) -> "NATBatchBuilder":
         """Set source rule source port."""
-        path = self.mappers[self.mapper_key].get_source_rule_source_port(rule_number, port)
-        return self.add_set(path)
+        path = self._g_source_rule_source_port(rule_number, port)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_source_port(self, rule_number: int) -> "NATBatchBuilder":
         """Delete source rule source port."""
-        path = self.mappers[self.mapper_key].get_source_rule_source_port_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_source_rule_source_port_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_source_rule_translation_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set source rule translation address."""
-        path = self.mappers[self.mapper_key].get_source_rule_translation_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_source_rule_translation_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_source_rule_translation_address(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete source rule translation address."""
-        path = self.mappers[self.mapper_key].get_source_rule_translation_address_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_source_rule_translation_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     # ========================================================================
     # Destination NAT Rule Operations
@@ -324,303 +373,287 @@ class NATBatchBuilder:
 
     def set_destination_rule(self, rule_number: int) -> "NATBatchBuilder":
         """Create destination NAT rule."""
-        path = self.mappers[self.mapper_key].get_destination_rule(rule_number)
-        return self.add_set(path)
+        path = self._g_destination_rule(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination NAT rule."""
-        path = self.mappers[self.mapper_key].get_destination_rule(rule_number)
-        return self.add_delete(path)
+        path = self._g_destination_rule(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_packet_type(
         self, rule_number: int, packet_type: str
     ) -> "NATBatchBuilder":
         """Set destination rule packet-type."""
-        path = self.mappers[self.mapper_key].get_destination_rule_packet_type(
-            rule_number, packet_type
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_packet_type(rule_number, packet_type)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_packet_type(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination rule packet-type."""
-        path = self.mappers[self.mapper_key].get_destination_rule_packet_type_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_packet_type_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_description(
         self, rule_number: int, description: str
     ) -> "NATBatchBuilder":
         """Set destination rule description."""
-        path = self.mappers[self.mapper_key].get_destination_rule_description(
-            rule_number, description
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_description(rule_number, description)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_description(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination rule description."""
-        path = self.mappers[self.mapper_key].get_destination_rule_description_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_description_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_destination_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set destination rule destination address."""
-        path = self.mappers[self.mapper_key].get_destination_rule_destination_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_destination_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_destination_address(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule destination address."""
-        path = self.mappers[self.mapper_key].get_destination_rule_destination_address_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_destination_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_destination_group(
         self, rule_number: int, group_type: str, group_name: str
     ) -> "NATBatchBuilder":
         """Set destination rule destination group."""
-        path = self.mappers[self.mapper_key].get_destination_rule_destination_group(
+        path = self._g_destination_rule_destination_group(
             rule_number, group_type, group_name
         )
-        return self.add_set(path)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_destination_group(
         self, rule_number: int, group_type: str
     ) -> "NATBatchBuilder":
         """Delete destination rule destination group."""
-        path = self.mappers[self.mapper_key].get_destination_rule_destination_group_path(
-            rule_number, group_type
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_destination_group_path(rule_number, group_type)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_destination_port(
         self, rule_number: int, port: str
     ) -> "NATBatchBuilder":
         """Set destination rule destination port."""
-        path = self.mappers[self.mapper_key].get_destination_rule_destination_port(
-            rule_number, port
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_destination_port(rule_number, port)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_destination_port(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule destination port."""
-        path = self.mappers[self.mapper_key].get_destination_rule_destination_port_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_destination_port_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_disable(self, rule_number: int) -> "NATBatchBuilder":
         """Set destination rule disable flag."""
-        path = self.mappers[self.mapper_key].get_destination_rule_disable(rule_number)
-        return self.add_set(path)
+        path = self._g_destination_rule_disable(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_disable(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination rule disable flag (enable the rule)."""
-        path = self.mappers[self.mapper_key].get_destination_rule_disable(rule_number)
-        return self.add_delete(path)
+        path = self._g_destination_rule_disable(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_exclude(self, rule_number: int) -> "NATBatchBuilder":
         """Set destination rule exclude flag."""
-        path = self.mappers[self.mapper_key].get_destination_rule_exclude(rule_number)
-        return self.add_set(path)
+        path = self._g_destination_rule_exclude(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_exclude(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination rule exclude flag."""
-        path = self.mappers[self.mapper_key].get_destination_rule_exclude(rule_number)
-        return self.add_delete(path)
+        path = self._g_destination_rule_exclude(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_load_balance_hash(
         self, rule_number: int, hash_type: str
     ) -> "NATBatchBuilder":
         """Set destination rule load-balance hash."""
-        path = self.mappers[self.mapper_key].get_destination_rule_load_balance_hash(
-            rule_number, hash_type
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_load_balance_hash(rule_number, hash_type)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_load_balance_hash(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule load-balance hash."""
-        path = self.mappers[self.mapper_key].get_destination_rule_load_balance_hash_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_load_balance_hash_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_load_balance_backend(
         self, rule_number: int, backend: str
     ) -> "NATBatchBuilder":
         """Set destination rule load-balance backend."""
-        path = self.mappers[self.mapper_key].get_destination_rule_load_balance_backend(
-            rule_number, backend
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_load_balance_backend(rule_number, backend)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_load_balance_backend(
         self, rule_number: int, backend: str
     ) -> "NATBatchBuilder":
         """Delete destination rule load-balance backend."""
-        path = self.mappers[self.mapper_key].get_destination_rule_load_balance_backend_path(
-            rule_number, backend
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_load_balance_backend_path(rule_number, backend)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_log(self, rule_number: int) -> "NATBatchBuilder":
         """Set destination rule log flag."""
-        path = self.mappers[self.mapper_key].get_destination_rule_log(rule_number)
-        return self.add_set(path)
+        path = self._g_destination_rule_log(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_log(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination rule log flag."""
-        path = self.mappers[self.mapper_key].get_destination_rule_log(rule_number)
-        return self.add_delete(path)
+        path = self._g_destination_rule_log(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_inbound_interface_name(
         self, rule_number: int, interface: str
     ) -> "NATBatchBuilder":
         """Set destination rule inbound-interface name."""
-        path = self.mappers[self.mapper_key].get_destination_rule_inbound_interface_name(
-            rule_number, interface
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_inbound_interface_name(rule_number, interface)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_inbound_interface_name(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule inbound-interface name."""
-        path = self.mappers[self.mapper_key].get_destination_rule_inbound_interface_name_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_inbound_interface_name_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_inbound_interface_group(
         self, rule_number: int, group: str
     ) -> "NATBatchBuilder":
         """Set destination rule inbound-interface group."""
-        path = self.mappers[self.mapper_key].get_destination_rule_inbound_interface_group(
-            rule_number, group
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_inbound_interface_group(rule_number, group)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_inbound_interface_group(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule inbound-interface group."""
-        path = self.mappers[self.mapper_key].get_destination_rule_inbound_interface_group_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_inbound_interface_group_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_protocol(
         self, rule_number: int, protocol: str
     ) -> "NATBatchBuilder":
         """Set destination rule protocol."""
-        path = self.mappers[self.mapper_key].get_destination_rule_protocol(
-            rule_number, protocol
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_protocol(rule_number, protocol)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_protocol(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination rule protocol."""
-        path = self.mappers[self.mapper_key].get_destination_rule_protocol_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_destination_rule_protocol_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_source_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set destination rule source address."""
-        path = self.mappers[self.mapper_key].get_destination_rule_source_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_source_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_source_address(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule source address."""
-        path = self.mappers[self.mapper_key].get_destination_rule_source_address_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_source_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_source_group(
         self, rule_number: int, group_type: str, group_name: str
     ) -> "NATBatchBuilder":
         """Set destination rule source group."""
-        path = self.mappers[self.mapper_key].get_destination_rule_source_group(
+        path = self._g_destination_rule_source_group(
             rule_number, group_type, group_name
         )
-        return self.add_set(path)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_source_group(
         self, rule_number: int, group_type: str
     ) -> "NATBatchBuilder":
         """Delete destination rule source group."""
-        path = self.mappers[self.mapper_key].get_destination_rule_source_group_path(
-            rule_number, group_type
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_source_group_path(rule_number, group_type)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_source_port(
         self, rule_number: int, port: str
     ) -> "NATBatchBuilder":
         """Set destination rule source port."""
-        path = self.mappers[self.mapper_key].get_destination_rule_source_port(
-            rule_number, port
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_source_port(rule_number, port)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_source_port(self, rule_number: int) -> "NATBatchBuilder":
         """Delete destination rule source port."""
-        path = self.mappers[self.mapper_key].get_destination_rule_source_port_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_source_port_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_translation_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set destination rule translation address."""
-        path = self.mappers[self.mapper_key].get_destination_rule_translation_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_translation_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_translation_address(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule translation address."""
-        path = self.mappers[self.mapper_key].get_destination_rule_translation_address_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_translation_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_destination_rule_translation_port(
         self, rule_number: int, port: str
     ) -> "NATBatchBuilder":
         """Set destination rule translation port."""
-        path = self.mappers[self.mapper_key].get_destination_rule_translation_port(
-            rule_number, port
-        )
-        return self.add_set(path)
+        path = self._g_destination_rule_translation_port(rule_number, port)
+        self._operations.append(("set", path))
+        return self
 
     def delete_destination_rule_translation_port(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete destination rule translation port."""
-        path = self.mappers[self.mapper_key].get_destination_rule_translation_port_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_destination_rule_translation_port_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     # ========================================================================
     # Static NAT Rule Operations
@@ -628,79 +661,101 @@ class NATBatchBuilder:
 
     def set_static_rule(self, rule_number: int) -> "NATBatchBuilder":
         """Create static NAT rule."""
-        path = self.mappers[self.mapper_key].get_static_rule(rule_number)
-        return self.add_set(path)
+        path = self._g_static_rule(rule_number)
+        self._operations.append(("set", path))
+        return self
 
     def delete_static_rule(self, rule_number: int) -> "NATBatchBuilder":
         """Delete static NAT rule."""
-        path = self.mappers[self.mapper_key].get_static_rule(rule_number)
-        return self.add_delete(path)
+        path = self._g_static_rule(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_static_rule_description(
         self, rule_number: int, description: str
     ) -> "NATBatchBuilder":
         """Set static rule description."""
-        path = self.mappers[self.mapper_key].get_static_rule_description(
-            rule_number, description
-        )
-        return self.add_set(path)
+        path = self._g_static_rule_description(rule_number, description)
+        self._operations.append(("set", path))
+        return self
 
     def delete_static_rule_description(self, rule_number: int) -> "NATBatchBuilder":
         """Delete static rule description."""
-        path = self.mappers[self.mapper_key].get_static_rule_description_path(rule_number)
-        return self.add_delete(path)
+        path = self._g_static_rule_description_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_static_rule_destination_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set static rule destination address."""
-        path = self.mappers[self.mapper_key].get_static_rule_destination_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_static_rule_destination_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_static_rule_destination_address(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete static rule destination address."""
-        path = self.mappers[self.mapper_key].get_static_rule_destination_address_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_static_rule_destination_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_static_rule_inbound_interface(
         self, rule_number: int, interface: str
     ) -> "NATBatchBuilder":
         """Set static rule inbound-interface."""
-        path = self.mappers[self.mapper_key].get_static_rule_inbound_interface(
-            rule_number, interface
-        )
-        return self.add_set(path)
+        path = self._g_static_rule_inbound_interface(rule_number, interface)
+        self._operations.append(("set", path))
+        return self
 
     def delete_static_rule_inbound_interface(self, rule_number: int) -> "NATBatchBuilder":
         """Delete static rule inbound-interface."""
-        path = self.mappers[self.mapper_key].get_static_rule_inbound_interface_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_static_rule_inbound_interface_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
 
     def set_static_rule_translation_address(
         self, rule_number: int, address: str
     ) -> "NATBatchBuilder":
         """Set static rule translation address."""
-        path = self.mappers[self.mapper_key].get_static_rule_translation_address(
-            rule_number, address
-        )
-        return self.add_set(path)
+        path = self._g_static_rule_translation_address(rule_number, address)
+        self._operations.append(("set", path))
+        return self
 
     def delete_static_rule_translation_address(
         self, rule_number: int
     ) -> "NATBatchBuilder":
         """Delete static rule translation address."""
-        path = self.mappers[self.mapper_key].get_static_rule_translation_address_path(
-            rule_number
-        )
-        return self.add_delete(path)
+        path = self._g_static_rule_translation_address_path(rule_number)
+        self._operations.append(("delete", path))
+        return self
+
+    # ========================================================================
+    # Bulk Operations
+    # ========================================================================
+
+    def bulk_apply(self, ops: Iterable[Tuple[Any, ...]]) -> "NATBatchBuilder":
+        """
+        Apply a sequence of NAT operations in one call.
+
+        Each op is (action, name, *args): action is "set" or "delete", name is
+        the set_*/delete_* method name without the prefix, and args are that
+        method's arguments, e.g. ("set", "source_rule_protocol", 10, "tcp") or
+        ("delete", "destination_rule", 20). All ops are resolved before any is
+        applied, so an unknown one leaves the batch unchanged.
+        """
+        resolved = []
+        for action, name, *args in ops:
+            getter = _BULK_GETTERS.get((action, name))
+            if getter is None:
+                raise ValueError(f"Unsupported NAT operation: {action} {name}")
+            resolved.append((action, getattr(self, getter), args))
+
+        append = self._operations.append
+        for action, getter, args in resolved:
+            append((action, getter(*args)))
+        return self
 
     # ========================================================================
     # Capabilities
@@ -708,73 +763,81 @@ class NATBatchBuilder:
 
     def get_capabilities(self) -> Dict[str, Any]:
         """Get capabilities for the current VyOS version."""
-        return {
-            "version": self.version,
-            "nat_types": {
-                "source": {
-                    "supported": True,
-                    "description": "Source NAT (SNAT) and Masquerade"
-                },
-                "destination": {
-                    "supported": True,
-                    "description": "Destination NAT (DNAT) for port forwarding"
-                },
-                "static": {
-                    "supported": True,
-                    "description": "Static 1:1 NAT mapping"
-                }
+        return dict(_build_capabilities(self.version))
+
+
+@lru_cache(maxsize=8)
+def _build_capabilities(version: str) -> Mapping[str, Any]:
+    """Build the read-only capabilities mapping for a VyOS version."""
+    capabilities = {
+        "version": version,
+        "nat_types": {
+            "source": {
+                "supported": True,
+                "description": "Source NAT (SNAT) and Masquerade"
             },
-            "operations": {
-                "source_nat": [
-                    "set_source_rule",
-                    "delete_source_rule",
-                    "set_source_rule_packet_type",
-                    "set_source_rule_description",
-                    "set_source_rule_destination_address",
-                    "set_source_rule_destination_group",
-                    "set_source_rule_destination_port",
-                    "set_source_rule_disable",
-                    "set_source_rule_exclude",
-                    "set_source_rule_load_balance_hash",
-                    "set_source_rule_load_balance_backend",
-                    "set_source_rule_log",
-                    "set_source_rule_outbound_interface_name",
-                    "set_source_rule_outbound_interface_group",
-                    "set_source_rule_protocol",
-                    "set_source_rule_source_address",
-                    "set_source_rule_source_group",
-                    "set_source_rule_source_port",
-                    "set_source_rule_translation_address"
-                ],
-                "destination_nat": [
-                    "set_destination_rule",
-                    "delete_destination_rule",
-                    "set_destination_rule_packet_type",
-                    "set_destination_rule_description",
-                    "set_destination_rule_destination_address",
-                    "set_destination_rule_destination_group",
-                    "set_destination_rule_destination_port",
-                    "set_destination_rule_disable",
-                    "set_destination_rule_exclude",
-                    "set_destination_rule_load_balance_hash",
-                    "set_destination_rule_load_balance_backend",
-                    "set_destination_rule_log",
-                    "set_destination_rule_inbound_interface_name",
-                    "set_destination_rule_inbound_interface_group",
-                    "set_destination_rule_protocol",
-                    "set_destination_rule_source_address",
-                    "set_destination_rule_source_group",
-                    "set_destination_rule_source_port",
-                    "set_destination_rule_translation_address",
-                    "set_destination_rule_translation_port"
-                ],
-                "static_nat": [
-                    "set_static_rule",
-                    "delete_static_rule",
-                    "set_static_rule_description",
-                    "set_static_rule_destination_address",
-                    "set_static_rule_inbound_interface",
-                    "set_static_rule_translation_address"
-                ]
+            "destination": {
+                "supported": True,
+                "description": "Destination NAT (DNAT) for port forwarding"
+            },
+            "static": {
+                "supported": True,
+                "description": "Static 1:1 NAT mapping"
             }
+        },
+        "operations": {
+            "source_nat": [
+                "set_source_rule",
+                "delete_source_rule",
+                "set_source_rule_packet_type",
+                "set_source_rule_description",
+                "set_source_rule_destination_address",
+                "set_source_rule_destination_group",
+                "set_source_rule_destination_port",
+                "set_source_rule_disable",
+                "set_source_rule_exclude",
+                "set_source_rule_load_balance_hash",
+                "set_source_rule_load_balance_backend",
+                "set_source_rule_log",
+                "set_source_rule_outbound_interface_name",
+                "set_source_rule_outbound_interface_group",
+                "set_source_rule_protocol",
+                "set_source_rule_source_address",
+                "set_source_rule_source_group",
+                "set_source_rule_source_port",
+                "set_source_rule_translation_address"
+            ],
+            "destination_nat": [
+                "set_destination_rule",
+                "delete_destination_rule",
+                "set_destination_rule_packet_type",
+                "set_destination_rule_description",
+                "set_destination_rule_destination_address",
+                "set_destination_rule_destination_group",
+                "set_destination_rule_destination_port",
+                "set_destination_rule_disable",
+                "set_destination_rule_exclude",
+                "set_destination_rule_load_balance_hash",
+                "set_destination_rule_load_balance_backend",
+                "set_destination_rule_log",
+                "set_destination_rule_inbound_interface_name",
+                "set_destination_rule_inbound_interface_group",
+                "set_destination_rule_protocol",
+                "set_destination_rule_source_address",
+                "set_destination_rule_source_group",
+                "set_destination_rule_source_port",
+                "set_destination_rule_translation_address",
+                "set_destination_rule_translation_port"
+            ],
+            "static_nat": [
+                "set_static_rule",
+                "delete_static_rule",
+                "set_static_rule_description",
+                "set_static_rule_destination_address",
+                "set_static_rule_inbound_interface",
+                "set_static_rule_translation_address"
+            ]
         }
+    }
+
+    return freeze_capabilities(capabilities)